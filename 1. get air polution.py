@@ -1,47 +1,99 @@
 # 從歷年的周統計資料中篩選出2016-2019的資料，以及需要的空汙因子，以利後續搭配健保資料進行分析
-import os
+# 平均值、最小值、最大值、標準差四種統計量一次讀進資料庫（statistic 欄位），下游可選用高峰（最大值）或變異（標準差）
+# 先依路徑與檔名建立檔案索引（年, 地區, 統計量, 測站），編碼判斷一次並記錄於 ingest_cache/，再以多執行緒同時處理
+# 結果依年份寫入測站資料庫 1_station_store/（station_helper），不再輸出數百個單站 CSV
+# 來源檔、輸出與篩選設定都沒有改變的年份直接略過（紀錄於 ingest_cache/manifest_1_station_store.json）
+import time
+
 import pandas as pd
 
+import ingest_helper as ingest
+import station_helper as station
+
 root_dir = "周統計資料_獨立"
-output_dir = "1_filtered_output"
-os.makedirs(output_dir, exist_ok=True)
+store_dir = station.FILTERED_STORE
 
-target_years = ['2015', '2016', '2017', '2018', '2019']
+target_years = [2015, 2016, 2017, 2018, 2019]
+statistics = station.STATISTICS
 columns_to_keep = ["日期", "地區", "NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
+workers = None  # 同時處理的檔案數，None 為 ThreadPoolExecutor 預設（CPU 核心數 + 4，最多 32）
+force = False  # True: 忽略紀錄，全部重新處理
+
+# 另外輸出舊格式的單站 CSV（1_filtered_output/<年>/<地區>/），None 表示不輸出
+export_dir = None
+
+manifest = ingest.Manifest.for_stage(store_dir)
+params = {"columns": columns_to_keep, "statistics": statistics}
+
+
+# 讀取單一檔案：只保留需要欄位、四捨五入，整理成資料庫的長表格式；失敗時回傳 None
+def load_file(file_path, encoding, area, stat, station_name):
+    try:
+        df = ingest.read_csv(file_path, encoding)
+
+        # 只保留需要欄位，並避免 SettingWithCopyWarning
+        df_filtered = df.loc[:, columns_to_keep].copy()
+
+        # 四捨五入數值欄位
+        numeric_cols = df_filtered.columns.difference(['日期', '地區'])
+        df_filtered.loc[:, numeric_cols] = df_filtered[numeric_cols].round(2)
+
+        out = pd.DataFrame({
+            "date": pd.to_datetime(df_filtered["日期"]),
+            "area": area,
+            "station": station_name,
+            "statistic": stat,
+        })
+        factors = [col for col in columns_to_keep if col not in ("日期", "地區")]
+        out[factors] = df_filtered[factors].to_numpy()
+        return out
+    except Exception as e:
+        print(f"❌ 錯誤: 無法處理 {file_path}，原因：{e}")
+        return None
+
+
+# 處理一個年份：讀取該年所有檔案並寫入資料庫分區；回傳 (處理檔案數, 失敗檔案數)，未改變略過時回傳 None
+def process_year(year, files, encodings):
+    output_path = station.partition_path(store_dir, year)
+    paths = list(files["path"])
+    if not force and manifest.is_current(output_path, paths, params):
+        return None
+
+    tasks = [(row.path, encodings[row.path], row.area, row.stat, row.station) for row in files.itertuples()]
+    frames = ingest.run_parallel(load_file, tasks, workers)
+    ok = [frame for frame in frames if frame is not None]
+    if not ok:
+        return 0, len(tasks)
+
+    df = pd.concat(ok, ignore_index=True)
+    station.write_partition(df, store_dir, year)
+    # 有檔案失敗時不記錄，下次重新處理
+    if len(ok) == len(tasks):
+        manifest.record(output_path, paths, params)
+    print(f"✅ 已處理: {year} 年 {len(ok)} 個檔案 → {output_path}")
+
+    if export_dir is not None:
+        df.insert(0, "year", year)
+        station.export_csv_tree(df, export_dir)
+    return len(ok), len(tasks) - len(ok)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    index = ingest.build_file_index(root_dir)
+    index = index[index["year"].isin(target_years) & index["stat"].isin(statistics)]
+    encodings = ingest.file_encodings(index["path"])
+
+    done = failed = skipped = 0
+    for year, files in index.groupby("year"):
+        result = process_year(year, files, encodings)
+        if result is None:
+            skipped += len(files)
+            print(f"⏭️ {year} 年來源未改變，略過")
+            continue
+        done += result[0]
+        failed += result[1]
 
-for dirpath, dirnames, filenames in os.walk(root_dir):
-    for filename in filenames:
-        if filename.endswith(".csv") and "平均值" in filename:
-            for year in target_years:
-                if year in filename:
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        # 嘗試不同編碼讀取
-                        try:
-                            df = pd.read_csv(file_path, encoding="utf-8-sig")
-                        except UnicodeDecodeError:
-                            df = pd.read_csv(file_path, encoding="cp950")
-
-                        # 只保留需要欄位，並避免 SettingWithCopyWarning
-                        df_filtered = df.loc[:, columns_to_keep].copy()
-
-                        # 四捨五入數值欄位
-                        numeric_cols = df_filtered.columns.difference(['日期', '地區'])
-                        df_filtered.loc[:, numeric_cols] = df_filtered[numeric_cols].round(2)
-
-                        # 處理相對路徑，移除第四層結構（保留前兩層）
-                        relative_path = os.path.relpath(dirpath, root_dir)
-                        parts = relative_path.split(os.sep)
-                        trimmed_path = os.path.join(*parts[:2]) if len(parts) >= 2 else relative_path
-
-                        # 建立輸出目錄
-                        output_subdir = os.path.join(output_dir, trimmed_path)
-                        os.makedirs(output_subdir, exist_ok=True)
-
-                        # 儲存檔案
-                        output_path = os.path.join(output_subdir, filename)
-                        df_filtered.to_csv(output_path, index=False, encoding="utf-8-sig")
-                        print(f"✅ 已處理: {output_path}")
-                    except Exception as e:
-                        print(f"❌ 錯誤: 無法處理 {file_path}，原因：{e}")
-                    break
+    manifest.save()
+    print(f"⏱️ 共 {len(index)} 個檔案：處理 {done} 個、未改變略過 {skipped} 個、"
+          f"失敗 {failed} 個，{time.perf_counter() - start:.1f} 秒")
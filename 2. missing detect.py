@@ -1,39 +1,88 @@
-# 偵測缺值，並把缺值情況統計結果輸出成missing_values_summary.csv，供內插法補值前後使用
+# 偵測缺值，並把缺值情況統計結果輸出成缺值摘要，供內插法補值前後使用
+# 從測站資料庫讀取（補值前 1_station_store、補值後 3_station_store），每種統計量每年整理成 測站 × 週 × 測項 的缺值遮罩
+# 以 run-length 一次算出每個 測站 × 測項 × 年 的缺值數、最長連續缺值與其起訖日期；沒有紀錄的週也算缺值
+# 輸出：2_missing_census/<資料庫>[_<統計量>]/missing_summary.csv 與每年的缺值遮罩 missing_mask_<年>.npz
+# 1_station_store 的缺值遮罩由 3. fill missing.py 讀取，決定哪些缺值段落做線性內插或鄰近測站補值
 import os
+import time
+
+import numpy as np
 import pandas as pd
 
-# 輸出資料夾路徑（你之前處理好的結果）
-input_dir = "3_interpolated_output"
-
-# 儲存缺值紀錄的清單
-missing_records = []
-
-# 遞迴走訪每個輸出的 CSV 檔案
-for dirpath, dirnames, filenames in os.walk(input_dir):
-    for filename in filenames:
-        if filename.endswith(".csv"):
-            file_path = os.path.join(dirpath, filename)
-            try:
-                df = pd.read_csv(file_path, encoding="utf-8-sig")
-
-                # 找出每個欄位為 NaN 的位置
-                for row_idx, row in df.iterrows():
-                    for col in df.columns:
-                        if pd.isna(row[col]):
-                            missing_records.append({
-                                "日期": row["日期"] if "日期" in row else None,
-                                "地區": row["地區"] if "地區" in row else None,
-                                "測項": col,
-                            })
-
-            except Exception as e:
-                print(f"❌ 無法讀取 {file_path}，錯誤原因：{e}")
-
-# 組成 DataFrame 並匯出
-if missing_records:
-    missing_df = pd.DataFrame(missing_records)
-    output_path = os.path.join(input_dir, "missing_values_summary.csv")
-    missing_df.to_csv(output_path, index=False, encoding="utf-8-sig")
-    print(f"✅ 缺值紀錄已儲存：{output_path}")
-else:
-    print("✅ 所有檔案中皆無缺值。")
+import gap_helper as gap
+import ingest_helper as ingest
+import station_helper as station
+
+# 要檢查的資料庫：補值前（遮罩供 3. fill missing.py 使用）與補值後（檢查補值結果）
+input_stores = [station.FILTERED_STORE, station.INTERPOLATED_STORE]
+statistics = station.STATISTICS
+factors = station.FACTORS
+
+# 記錄每個缺值遮罩由哪個年份分區產生，3. fill missing.py 只使用來源沒有改變的遮罩
+manifest = ingest.Manifest.for_stage(gap.CENSUS_DIR)
+
+# 摘要中另外列出最長連續缺值超過此週數的 測站 × 測項（與 3. fill missing.py 的 skip_threshold 相同）
+report_threshold = 27
+
+
+# 一年的缺值摘要：每個 測站 × 測項 一列；缺值遮罩另存成 missing_mask_<年>.npz
+def census_year(input_store, statistic, year, df):
+    cube, stations, areas, dates = station.to_cube(df, factors)
+    mask = np.isnan(cube)
+    path = gap.mask_path(input_store, year, statistic)
+    gap.save_mask(path, mask, stations, dates, factors)
+    manifest.record(path, [station.partition_path(input_store, year)], {"factors": factors, "statistic": statistic})
+
+    # (測站, 週, 測項) → (測站, 測項, 週)，沿週計算
+    count, longest, start, end = gap.gap_stats(mask.transpose(0, 2, 1))
+    date_labels = np.asarray(dates.strftime("%Y-%m-%d"))
+    return pd.DataFrame({
+        "year": year,
+        "area": np.repeat(areas, len(factors)),
+        "station": np.repeat(stations, len(factors)),
+        "factor": np.tile(factors, len(stations)),
+        "weeks": len(dates),
+        "missing": count.ravel(),
+        "longest_gap": longest.ravel(),
+        "gap_start": np.where(start.ravel() >= 0, date_labels[start.ravel()], ""),
+        "gap_end": np.where(end.ravel() >= 0, date_labels[end.ravel()], ""),
+    })
+
+
+# 一個資料庫、一種統計量的普查，回傳摘要（沒有資料時回傳 None）
+def census_store(input_store, statistic):
+    summaries = []
+    for year in station.store_years(input_store):
+        df = station.read_store(input_store, years=[year], columns=["date", "area", "station"] + factors, statistic=statistic)
+        if len(df):
+            summaries.append(census_year(input_store, statistic, year, df))
+
+    if not summaries:
+        print(f"⚠️ 資料庫中沒有資料：{input_store}（{statistic}）")
+        return None
+
+    summary = pd.concat(summaries, ignore_index=True)
+    output_dir = gap.census_dir(input_store, statistic)
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, "missing_summary.csv")
+    summary.to_csv(output_path, index=False, encoding="utf-8-sig")
+    print(f"✅ 缺值摘要已儲存：{output_path}（共 {len(summary)} 列，缺值共 {summary['missing'].sum()} 週）")
+    return summary
+
+
+if __name__ == "__main__":
+    start_time = time.perf_counter()
+    for input_store in input_stores:
+        for statistic in statistics:
+            summary = census_store(input_store, statistic)
+            if summary is None:
+                continue
+            if summary["missing"].sum() == 0:
+                print(f"✅ {input_store}（{statistic}）所有測站皆無缺值。")
+            long_gaps = summary[summary["longest_gap"] > report_threshold]
+            if statistic == station.DEFAULT_STATISTIC and len(long_gaps):
+                print(f"\n⚠️ {input_store} 最長連續缺值超過 {report_threshold} 週（不補值）：")
+                print(long_gaps.to_string(index=False))
+
+    manifest.save()
+    print(f"⏱️ 普查完成，{time.perf_counter() - start_time:.2f} 秒")
@@ -1,59 +1,165 @@
 # 執行內插法補值
-import os
+# 從測站資料庫 1_station_store/ 依年份讀取，補值後寫入 3_station_store/
+# 每年每種統計量整理成 測站 × 週 × 測項 陣列，最長連續缺值與線性內插都對整個陣列一次計算（gap_helper）
+# 缺值位置取自 2. missing detect.py 存下的 1_station_store 缺值遮罩；遮罩不存在或來源已改變時才由資料判斷
+# 補值完成後另寫出每種統計量的測站立方體 3_station_cube/<統計量>.npy（測站 × 週 × 測項，附座標），IDW 直接讀取
+# neighbor_fill = True 時，超過 skip_threshold 的長缺值改以相關最高的鄰近測站迴歸補值，不再整年從 IDW 消失
+# 來源分區與補值設定都沒有改變的年份直接略過（紀錄於 ingest_cache/manifest_3_station_store.json）
+import numpy as np
 import pandas as pd
 
-input_dir = "1_filtered_output"
-output_dir = "3_interpolated_output"
-os.makedirs(output_dir, exist_ok=True)
+import gap_helper as gap
+import ingest_helper as ingest
+import station_helper as station
+
+input_store = station.FILTERED_STORE
+output_store = station.INTERPOLATED_STORE
 
 # 需要補值的欄位（不含日期、地區）
 value_columns = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
 skip_threshold = 27  # 超過 27 週缺值不補
+force = False  # True: 忽略紀錄，全部重新補值
 
-# 補值處理函數
-def interpolate_file(file_path, output_path):
-    try:
-        df = pd.read_csv(file_path, encoding="utf-8-sig")
+# 鄰近測站補值：每個 測站 × 測項 取相關係數最高的 neighbor_k 個測站（所有年份合併計算相關），各自做線性迴歸後以 r² 加權平均
+neighbor_fill = False
+neighbor_k = 3
+neighbor_min_corr = 0.6  # 相關係數低於此值的測站不當作鄰近測站
+neighbor_min_overlap = 52  # 兩站同時有值的最少週數
 
-        # 確保日期正確排序
-        df['日期'] = pd.to_datetime(df['日期'], errors='coerce')
-        df = df.sort_values('日期').reset_index(drop=True)
+# 另外輸出舊格式的單站 CSV（3_interpolated_output/<年>/<地區>/），None 表示不輸出
+export_dir = None
 
-        df_interp = df.copy()
+manifest = ingest.Manifest.for_stage(output_store)
+census_manifest = ingest.Manifest.for_stage(gap.CENSUS_DIR)
+mask_fallbacks = []  # 沒有可用缺值遮罩、改由資料判斷缺值的 年份 × 統計量
+params = {"columns": value_columns, "skip_threshold": skip_threshold}
+if neighbor_fill:
+    params["neighbor"] = {"k": neighbor_k, "min_corr": neighbor_min_corr, "min_overlap": neighbor_min_overlap}
 
-        for col in value_columns:
-            if col not in df_interp.columns:
-                continue
 
-            # 找出連續缺值區間長度
-            null_series = df_interp[col].isna().astype(int)
-            groups = (null_series.diff(1) != 0).cumsum()
-            max_consec_na = null_series.groupby(groups).sum().max()
+# 各統計量、各測項的鄰近測站索引，以資料庫所有年份計算一次；回傳 {統計量: (測站, {測項: 索引})}
+def build_neighbor_indexes():
+    indexes = {}
+    df = station.read_store(input_store)
+    for statistic, sub in df.groupby("statistic", observed=True):
+        cube, stations, areas, dates = station.to_cube(sub, value_columns)
+        indexes[statistic] = (stations, {
+            factor: gap.neighbor_index(cube[:, :, f], neighbor_k, neighbor_min_corr, neighbor_min_overlap)
+            for f, factor in enumerate(value_columns)
+        })
+    return indexes
+
+
+# 2. missing detect.py 存下的缺值遮罩 (測站數, 週數, 測項數)，依 stations、dates 對齊
+# 遮罩不存在、來源分區在普查後改變或標籤不符時回傳 None
+def census_mask(year, statistic, stations, dates):
+    path = gap.mask_path(input_store, year, statistic)
+    params = {"factors": station.FACTORS, "statistic": statistic}
+    if not census_manifest.is_current(path, [station.partition_path(input_store, year)], params):
+        return None
+    return gap.aligned_mask(path, stations, dates, value_columns)
+
+
+# 一種統計量一年的補值：整理成 (測站數, 週數, 測項數) 陣列，所有測站與測項一次計算
+# 每個 測站 × 測項 的最長連續缺值以 run-length 計算，超過 skip_threshold 的不補；沒有紀錄的週也算缺值，但不寫回
+# neighbors 為該統計量的 (測站, {測項: 索引})，有值時長缺值以鄰近測站補值
+def interpolate_statistic(df, year, statistic, neighbors=None):
+    label = f"{year} ({statistic})"
+    cube, stations, areas, dates = station.to_cube(df, value_columns)
+    missing = census_mask(year, statistic, stations, dates)
+    if missing is None:
+        missing = np.isnan(cube)
+        mask_fallbacks.append(label)
+
+    # (測站, 週, 測項) → (測站, 測項, 週)，沿週計算
+    values = cube.transpose(0, 2, 1)
+    longest = gap.max_gap(missing.transpose(0, 2, 1))
+    skip = longest > skip_threshold
+    for s, f in zip(*np.nonzero(skip)):
+        print(f"⏭️ 跳過補值: {label} {stations[s]} 欄位 {value_columns[f]}，連續缺值達 {longest[s, f]} 週")
+
+    linear = missing.transpose(0, 2, 1) & ~skip[:, :, None]
+    filled = np.where(linear, gap.fill_linear(values), values).transpose(0, 2, 1)
+    if neighbors is not None and skip.any():
+        fill_long_gaps(filled, skip, missing, stations, neighbors, label)
 
-            # 若連續缺值超過27筆，不補這個欄位
-            if max_consec_na > skip_threshold:
-                print(f"⏭️ 跳過補值: {os.path.basename(file_path)} 欄位 {col}，連續缺值達 {max_consec_na} 週")
+    df_interp = df.copy()
+    rows = pd.Index(stations).get_indexer(df["station"].astype(str))
+    weeks = dates.get_indexer(df["date"])
+    df_interp[value_columns] = filled[rows, weeks]
+    return df_interp
+
+
+# 長缺值的 測站 × 測項 以鄰近測站補值（就地修改 filled，只補 missing 標記的週）；鄰近測站使用已做完時間內插的值
+# 沒有可用鄰近測站（例如該測站從未量測此測項）或鄰近測站在缺值週也沒有值的，維持缺值，每年每種統計量合併列出一次
+def fill_long_gaps(filled, skip, missing, stations, neighbors, label):
+    model_stations, factor_indexes = neighbors
+    rows = pd.Index(model_stations).get_indexer(stations)
+    unfilled = []
+    for f, factor in enumerate(value_columns):
+        if not skip[:, f].any():
+            continue
+        index = factor_indexes[factor]
+        full = np.full((len(model_stations), filled.shape[1]), np.nan)
+        full[rows] = filled[:, :, f]
+        estimate = np.maximum(gap.fill_from_neighbors(full, index)[rows], 0)  # 濃度不為負
+
+        for s in np.nonzero(skip[:, f])[0]:
+            gaps = missing[s, :, f]
+            n_filled = (gaps & ~np.isnan(estimate[s])).sum()
+            if rows[s] < 0 or (index["neighbors"][rows[s]] < 0).all() or n_filled == 0:
+                unfilled.append(f"{stations[s]} {factor}")
                 continue
+            filled[s, :, f] = np.where(gaps, estimate[s], filled[s, :, f])
+            print(f"🔗 鄰近測站補值: {label} {stations[s]} 欄位 {factor}，補 {n_filled} / {gaps.sum()} 週")
+
+    if unfilled:
+        print(f"⏭️ 無可用鄰近測站，維持缺值: {label} {'、'.join(unfilled)}")
 
-            # 否則使用線性補值
-            df_interp[col] = df_interp[col].interpolate(method='linear', limit_direction='both')
+
+# 補值一個年份分區，回傳 "done"、"skipped"（來源未改變）或 "failed"
+# neighbor_indexes 為 build_neighbor_indexes() 的結果（鄰近測站索引由所有年份計算，因此所有年份分區都算來源）
+def interpolate_year(year, neighbor_indexes=None):
+    input_paths = [station.partition_path(input_store, year)]
+    if neighbor_indexes is not None:
+        input_paths = [station.partition_path(input_store, y) for y in station.store_years(input_store)]
+    output_path = station.partition_path(output_store, year)
+    if not force and manifest.is_current(output_path, input_paths, params):
+        return "skipped"
+
+    try:
+        df = station.read_store(input_store, years=[year])
+        filled = [
+            interpolate_statistic(sub, year, statistic,
+                                  None if neighbor_indexes is None else neighbor_indexes.get(statistic))
+            for statistic, sub in df.groupby("statistic", observed=True)
+        ]
+        df_interp = pd.concat(filled, ignore_index=True)
 
         # 儲存補值後的資料
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df_interp.to_csv(output_path, index=False, encoding="utf-8-sig")
-        print(f"✅ 已補值: {output_path}")
+        station.write_partition(df_interp, output_store, year)
+        manifest.record(output_path, input_paths, params)
+        print(f"✅ 已補值: {year} 年 {len(filled)} 種統計量 → {output_path}")
+
+        if export_dir is not None:
+            station.export_csv_tree(df_interp, export_dir)
+        return "done"
 
     except Exception as e:
-        print(f"❌ 錯誤: {file_path} 無法補值，原因：{e}")
+        print(f"❌ 錯誤: {year} 年無法補值，原因：{e}")
+        return "failed"
 
-# 遍歷所有檔案並補值
-for dirpath, dirnames, filenames in os.walk(input_dir):
-    for filename in filenames:
-        if filename.endswith(".csv"):
-            file_path = os.path.join(dirpath, filename)
 
-            # 保留相對結構
-            relative_path = os.path.relpath(file_path, input_dir)
-            output_path = os.path.join(output_dir, relative_path)
+if __name__ == "__main__":
+    years = station.store_years(input_store)
+    neighbor_indexes = build_neighbor_indexes() if neighbor_fill else None
+    results = [interpolate_year(year, neighbor_indexes) for year in years]
+    manifest.save()
+    if mask_fallbacks:
+        print(f"⚠️ {len(mask_fallbacks)} 組 年份 × 統計量 沒有可用的缺值遮罩（先執行 2. missing detect.py），"
+              f"改由資料判斷缺值：{', '.join(mask_fallbacks)}")
 
-            interpolate_file(file_path, output_path)
+    # 測站立方體由補值後的資料庫重建（讀取很快，未改變的年份也一併納入）
+    for statistic in station.STATISTICS:
+        station.write_station_cube(output_store, statistic, value_columns)
+    print(f"⏱️ 共 {len(results)} 個年份：補值 {results.count('done')} 個、未改變略過 {results.count('skipped')} 個、失敗 {results.count('failed')} 個")
@@ -1,13 +1,17 @@
 # 將個別站點資料整合成所有站點合併的年度周資料
 # 原本: 二林各空汙因子值1-52周、大里各空汙因子值1-52周...
 # 整理後: NO-所有站點1-52周的值、PM25-所有站點1-52周的值...
+# IDW（5、6-x）改讀 3. fill missing.py 寫出的測站立方體 3_station_cube/，這裡輸出的寬表只供仍讀取舊格式的程式使用
+# 從測站資料庫 3_station_store/ 每年只讀取一次（日期、地區、測站與各測項欄位），以一次 pivot 整理出七個測項的寬表
 import os
 import pandas as pd
-import re
 
-def process_interpolated_files_stationwise():
-    input_dir = r'3_interpolated_output'
-    output_base_dir = r'4_interpolated_yearly_stationwise'
+import station_helper as station
+
+# statistic: 平均值輸出到 4_interpolated_yearly_stationwise，其他統計量輸出到 4_interpolated_yearly_stationwise_<統計量>
+def process_interpolated_files_stationwise(statistic=station.DEFAULT_STATISTIC):
+    input_store = station.INTERPOLATED_STORE
+    output_base_dir = station.with_statistic(station.STATIONWISE_DIR, statistic)
     os.makedirs(output_base_dir, exist_ok=True)
 
     # 處理年份範圍
@@ -20,61 +24,45 @@ def process_interpolated_files_stationwise():
     target_factors = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
     factor_filename_map = {f: f.replace('.', '') for f in target_factors}  # 處理 PM2.5 -> PM25 檔名用
 
-    for factor in target_factors:
-        output_factor_name = factor_filename_map[factor]
-
-        for year in years:
-            print(f'\n📅 處理 {year} 年 {factor} 數據...')
-            dfs = []
-
-            year_path = os.path.join(input_dir, str(year))
-            if not os.path.exists(year_path):
-                print(f"⚠️ 路徑不存在：{year_path}")
-                continue
-
-            for area in areas:
-                area_path = os.path.join(year_path, area)
-                if not os.path.exists(area_path):
-                    continue
-
-                for filename in os.listdir(area_path):
-                    if filename.endswith(".csv"):
-                        file_path = os.path.join(area_path, filename)
-                        try:
-                            df = pd.read_csv(file_path, encoding='utf-8-sig')
-                            df['日期'] = pd.to_datetime(df['日期'], errors='coerce')
-
-                            # 從檔名提取測站名稱
-                            match = re.match(r"2_周統計_平均值_(.+?)_\d{4}\.csv", filename)
-                            if not match:
-                                print(f"❓ 無法從檔名提取測站名稱: {filename}")
-                                continue
-                            station_name = match.group(1)
-
-                            if factor in df.columns:
-                                sub_df = df[['日期', factor]].copy()
-                                sub_df.rename(columns={factor: station_name}, inplace=True)
-                                dfs.append(sub_df)
-                        except Exception as e:
-                            print(f"❌ 錯誤處理 {file_path}：{e}")
-
-            # 合併所有測站該測項的資料
-            if dfs:
-                merged_df = dfs[0]
-                for df in dfs[1:]:
-                    merged_df = pd.merge(merged_df, df, on='日期', how='outer')
-
-                merged_df.sort_values('日期', inplace=True)
-
-                # 儲存資料夾為 interpolated_yearly_stationwise/NO/、PM25/ 等
-                factor_output_dir = os.path.join(output_base_dir, output_factor_name)
-                os.makedirs(factor_output_dir, exist_ok=True)
-
-                output_file = os.path.join(factor_output_dir, f"{output_factor_name}_merged_{year}.csv")
-                merged_df.to_csv(output_file, index=False, encoding="utf-8-sig", na_rep='NaN')
-                print(f"✅ 已輸出：{output_file}（共 {len(merged_df)} 筆）")
-            else:
-                print(f"⏭️ 無資料：{year} 年 {factor}")
+    if not station.store_years(input_store):
+        print(f"⚠️ 路徑不存在：{input_store}")
+        return
+
+    for year in years:
+        print(f'\n📅 處理 {year} 年數據...')
+        if year not in station.store_years(input_store):
+            print(f"⚠️ 路徑不存在：{station.partition_path(input_store, year)}")
+            continue
+
+        # 每年只讀一次，七個測項一次 pivot 成 (日期 × (測項, 測站)) 寬表
+        df = station.read_store(input_store, years=[year], columns=['date', 'area', 'station'] + target_factors,
+                                statistic=statistic, areas=areas)
+        if df.empty:
+            print(f"⏭️ 無資料：{year} 年")
+            continue
+        df['station'] = df['station'].astype(str)
+        wide = df.pivot(index='date', columns='station', values=target_factors).sort_index()
+        wide.index.name = '日期'
+
+        # 測站順序：依 areas 順序，同地區內依測站名稱
+        stations = df[['area', 'station']].drop_duplicates()
+        stations['area'] = pd.Categorical(stations['area'].astype(str), categories=areas, ordered=True)
+        station_order = stations.sort_values(['area', 'station'])['station'].tolist()
+
+        for factor in target_factors:
+            output_factor_name = factor_filename_map[factor]
+            merged_df = wide[factor][station_order].reset_index()
+            merged_df.columns.name = None
+
+            # 儲存資料夾為 interpolated_yearly_stationwise/NO/、PM25/ 等
+            factor_output_dir = os.path.join(output_base_dir, output_factor_name)
+            os.makedirs(factor_output_dir, exist_ok=True)
+
+            output_file = os.path.join(factor_output_dir, f"{output_factor_name}_merged_{year}.csv")
+            merged_df.to_csv(output_file, index=False, encoding="utf-8-sig", na_rep='NaN')
+            print(f"✅ 已輸出：{output_file}（共 {len(merged_df)} 筆）")
 
 if __name__ == "__main__":
-    process_interpolated_files_stationwise()
+    # 需要其他統計量時加入，例如 "最大值"（高峰週暴露）
+    for statistic in ["平均值"]:
+        process_interpolated_files_stationwise(statistic)
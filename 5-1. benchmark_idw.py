@@ -0,0 +1,160 @@
+# 測試不同網格解析度下分塊 IDW 的執行時間與記憶體峰值（120 約 3 公里、480 約 800 公尺、1200 約 300 公尺）
+# 每個解析度在獨立的子程序中執行，峰值記憶體才不會互相影響
+# 另外比較不同網格大小 × 測站數（加入模擬的微型感測器）下 brute 與 KD-tree 建權重矩陣的時間，
+# 找出兩者的交叉點，並檢查 auto（idw.auto_method）的選擇是否為較快的方法
+import multiprocessing as mp
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import grid_helper as grid
+import idw_helper as idw
+import station_helper as station
+
+try:
+    import resource
+except ImportError:  # Windows 沒有 resource 模組，只回報 tracemalloc 峰值
+    resource = None
+
+grid_sizes = [120, 480, 1200]
+factor = "PM25"
+year = 2019
+input_dir = station.cube_path()  # 測站立方體（3. fill missing.py 產生）；也可指定 4_interpolated_yearly_stationwise 舊格式寬表資料夾
+
+# brute / KD-tree 比較用的網格與測站數（75 為實際測站，其餘在陸地網格內隨機模擬）
+# 小網格或少測站時 brute 較快：75 站以上時交叉點約在 網格數 × 測站數 10 萬，20 站時到 480x480 兩者才相當
+method_grid_sizes = [20, 40, 120, 480]
+site_counts = [5, 20, 75, 300, 1000]
+repeats = 3  # 每個組合取最快的一次，小網格的時間才不會被雜訊蓋過
+
+
+def peak_rss_mb():
+    if resource is None:
+        return float("nan")
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux 單位為 KB
+
+
+# 單一解析度：分塊算完一整年所有週，只累計有值網格數，不保留整個立方體
+def run_one(n):
+    site = idw.load_sites()
+    values, dates, found = idw.load_factor_cube(input_dir, year, [factor], site['site'])
+    values = values[:, :, 0]
+    spec = grid.GridSpec.with_size(n)
+    spec.land_mask()  # 遮罩的產生不計入 IDW 時間
+
+    rss_before = peak_rss_mb()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    n_valid = 0
+    n_tiles = 0
+    for r0, r1, tile in idw.iter_idw_tiles(site['lng'], site['lat'], values, spec):
+        n_valid += int((tile != -1).sum())
+        n_tiles += 1
+
+    elapsed = time.perf_counter() - start
+    traced_peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+
+    return {
+        "grid": f"{n}x{n}",
+        "cell_km": round(spec.lng_step * 101.7, 2),  # 北緯 24 度附近 1 經度約 101.7 公里
+        "weeks": len(dates),
+        "tiles": n_tiles,
+        "seconds": round(elapsed, 2),
+        "traced_peak_MB": round(traced_peak, 1),
+        "peak_rss_MB": round(max(peak_rss_mb(), rss_before), 1),
+        "valid_cells": n_valid,
+    }
+
+
+# 在陸地網格內隨機產生 n 個測站座標（固定亂數種子）
+def simulated_sites(n):
+    rng = np.random.default_rng(42)
+    spec = grid.DEFAULT_GRID
+    cells = np.argwhere(spec.land_mask())[rng.integers(0, int(spec.land_mask().sum()), n)]
+    lngs, lats = spec.coords()
+    lng = lngs[cells[:, 1]] + rng.uniform(0, spec.lng_step, n)
+    lat = lats[cells[:, 0]] - rng.uniform(0, spec.lat_step, n)
+    return lng, lat
+
+
+# 分塊建完整個網格的權重矩陣所需時間（repeats 次取最快）
+def time_weight_build(lng, lat, spec, method):
+    tile_rows = idw.tile_rows_for(spec, len(lng))
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        nnz = 0
+        for r0 in range(0, spec.rows, tile_rows):
+            W = idw.build_weight_matrix(lng, lat, spec, rows=slice(r0, min(r0 + tile_rows, spec.rows)), method=method)
+            nnz += W.nnz
+        best = min(best, time.perf_counter() - start)
+    return best, nnz
+
+
+def compare_methods():
+    site = idw.load_sites()
+    rows = []
+    for size in method_grid_sizes:
+        spec = grid.GridSpec.with_size(size)
+        for n_sites in site_counts:
+            if n_sites == len(site):
+                lng, lat = site['lng'].values, site['lat'].values
+            else:
+                lng, lat = simulated_sites(n_sites)
+            brute, nnz = time_weight_build(lng, lat, spec, "brute")
+            tree, _ = time_weight_build(lng, lat, spec, "kdtree")
+            pairs = spec.rows * spec.cols * n_sites
+            faster = "kdtree" if tree < brute else "brute"
+            # auto 依每一塊的網格數選擇，與 build_weight_matrix 分塊呼叫時相同
+            tile_cells = min(idw.tile_rows_for(spec, n_sites), spec.rows) * spec.cols
+            auto = idw.auto_method(tile_cells, n_sites)
+            rows.append({
+                "grid": f"{spec.rows}x{spec.cols}",
+                "sites": n_sites,
+                "cells_x_sites": pairs,
+                "pairs_in_300": nnz,
+                "brute_s": round(brute, 4),
+                "kdtree_s": round(tree, 4),
+                "faster": faster,
+                "auto": auto,
+                "auto_slowdown": round(max(brute, tree) / min(brute, tree), 2) if auto != faster else 1.0,
+            })
+            print(f"⏱️ {size}x{size} {n_sites} 站：brute {brute:.4f} 秒，KD-tree {tree:.4f} 秒")
+    return pd.DataFrame(rows)
+
+
+# 交叉點：各測站數下 brute 較快的最大 網格數 × 測站數，與 KD-tree 較快的最小值
+def report_crossover(df):
+    print(f"\n📊 交叉點（目前 KDTREE_MIN_PAIRS = {idw.KDTREE_MIN_PAIRS:,}，KDTREE_MIN_SITES = {idw.KDTREE_MIN_SITES}）：")
+    for n_sites, sub in df.groupby("sites"):
+        brute_max = sub.loc[sub["faster"] == "brute", "cells_x_sites"].max()
+        tree_min = sub.loc[sub["faster"] == "kdtree", "cells_x_sites"].min()
+        print(f"  {n_sites} 站：brute 較快最大 {brute_max:,.0f}，KD-tree 較快最小 {tree_min:,.0f}")
+    wrong = df[df["auto"] != df["faster"]]
+    if len(wrong):
+        print(f"⚠️ auto 選到較慢方法的組合（最多慢 {wrong['auto_slowdown'].max()} 倍）：")
+        print(wrong.to_string(index=False))
+    else:
+        print("✅ 所有組合 auto 都選到較快的方法")
+
+
+if __name__ == "__main__":
+    ctx = mp.get_context("spawn")
+    rows = []
+    for n in grid_sizes:
+        with ctx.Pool(1) as pool:
+            result = pool.apply(run_one, (n,))
+        print(f"⏱️ {result['grid']}：{result['seconds']} 秒，tracemalloc 峰值 {result['traced_peak_MB']} MB，RSS 峰值 {result['peak_rss_MB']} MB")
+        rows.append(result)
+
+    print()
+    print(pd.DataFrame(rows).to_string(index=False))
+
+    print()
+    methods = compare_methods()
+    print(methods.to_string(index=False))
+    report_crossover(methods)
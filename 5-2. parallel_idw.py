@@ -0,0 +1,104 @@
+# 平行版 IDW 插值：以 (測項, 年) 為工作單位分散到多個程序，結果與 5. inverse_weight16-19.ipynb 相同
+# 測站座標、權重矩陣與陸地遮罩在每個子程序啟動時載入一次（initializer），不隨每個工作傳遞
+# 每個工作先把該年網格寫到暫存分塊（先寫暫存檔再改名），一個測項的年份全部完成後再合併成網格立方體，中斷時不會留下寫到一半的檔案
+import multiprocessing as mp
+import os
+import shutil
+import time
+
+import numpy as np
+
+import grid_helper as grid
+import idw_helper as idw
+import station_helper as station
+
+factors = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
+years = range(2015, 2020)
+statistic = station.DEFAULT_STATISTIC  # 插值的統計量；平均值以外的網格立方體與 CSV 資料夾加上統計量名稱（例如 5_grid_store_最大值）
+input_dir = station.cube_path(statistic)  # 測站立方體（3. fill missing.py 產生）；也可指定 4_interpolated_yearly_stationwise 舊格式寬表資料夾
+output_base = station.with_statistic('./5_grid_output', statistic)
+export_csv = True  # 另外輸出舊格式每週 CSV 到 output_base
+workers = os.cpu_count()  # 程序數，None 或 0 表示使用所有核心
+
+# 每個 (測項, 年) 的暫存分塊，合併成立方體後刪除
+parts_dir = os.path.join(grid.grid_store_dir(statistic), "_parts")
+
+spec = grid.DEFAULT_GRID
+
+# 子程序共用的唯讀資料，由 init_worker 設定
+_sites = None
+_cache = None
+
+
+# 子程序初始化：權重矩陣由主程序先建好快取，這裡只讀取 idw_cache/ 的檔案
+def init_worker(sites, lng, lat, spec):
+    global _sites, _cache
+    _sites = sites
+    W = idw.load_weight_matrix(sites, lng, lat, spec)
+    _cache = idw.MaskWeightCache(W, spec.land_mask())
+
+
+# 單一 (測項, 年)：計算整年網格，寫入暫存分塊，回傳分塊路徑（沒有檔案時回傳 None）
+def run_unit(factor, year):
+    values, dates, found = idw.load_factor_cube(input_dir, year, [factor], _sites)
+    if not found:
+        return None
+    values = values[:, :, 0]
+
+    m2 = idw.idw_weeks(_cache, values).astype(np.float32)
+    empty_weeks = np.isnan(values).all(axis=0)
+    m2[empty_weeks] = np.nan
+    for date_str in dates[empty_weeks]:
+        print(f"⚠️ {factor} {date_str} 無任何資料，跳過")
+
+    path = os.path.join(parts_dir, f"{factor}_{year}.npz")
+    np.savez(path + ".tmp.npz", grids=m2, dates=np.asarray(dates, dtype=str))
+    os.replace(path + ".tmp.npz", path)
+    print(f"{year} 年 {factor} 共 {len(dates)} 筆完成")
+    return path
+
+
+# 將一個測項所有年份的分塊依年份順序合併成網格立方體，並視需要匯出 CSV
+def merge_factor(factor, paths, csv_dir):
+    grids, labels = [], []
+    for year, path in sorted(paths.items()):
+        with np.load(path) as part:
+            grids.append(part["grids"])
+            labels.extend((year, week, date_str) for week, date_str in enumerate(part["dates"], start=1))
+
+    grid.write_grid_cube(factor, np.concatenate(grids), labels, spec, statistic)
+    for path in paths.values():
+        os.remove(path)
+    if csv_dir is not None:
+        grid.export_csv(factor, csv_dir, statistic)
+
+
+def interpolate_parallel(factors, input_dir, output_base, export_csv=True, workers=None):
+    site = idw.load_sites()
+    # 主程序先建好權重矩陣快取，子程序只需讀檔
+    idw.load_weight_matrix(site['site'], site['lng'], site['lat'], spec)
+    os.makedirs(parts_dir, exist_ok=True)
+
+    units = [(factor, year) for factor in factors for year in years]
+    initargs = (list(site['site']), site['lng'].values, site['lat'].values, spec)
+
+    start = time.perf_counter()
+    with mp.get_context("spawn").Pool(workers or None, initializer=init_worker, initargs=initargs) as pool:
+        paths = pool.starmap(run_unit, units)
+
+        # 依測項整理分塊，每個測項的合併與 CSV 匯出也分給子程序
+        by_factor = {}
+        for (factor, year), path in zip(units, paths):
+            if path is not None:
+                by_factor.setdefault(factor, {})[year] = path
+        pool.starmap(merge_factor, [
+            (factor, by_factor[factor], os.path.join(output_base, factor) if export_csv else None)
+            for factor in factors if factor in by_factor
+        ])
+
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    print(f"⏱️ {len(units)} 個 (測項, 年) 工作完成，共 {time.perf_counter() - start:.1f} 秒")
+
+
+if __name__ == "__main__":
+    interpolate_parallel([factor.replace('.', '') for factor in factors], input_dir, output_base, export_csv, workers)  # PM2.5 → PM25
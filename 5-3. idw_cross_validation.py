@@ -0,0 +1,98 @@
+# IDW 參數驗證：留一交叉驗證（每週每個測站以其他測站預測）計算各測項的 RMSE / MAE
+# 測站距離矩陣只算一次，每組參數以一次矩陣乘法算完 2015–2019 所有週；power 與 cutoff 的組合分給多個程序平行計算
+import itertools
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import idw_helper as idw
+import station_helper as station
+
+factors = ["NO", "NO2", "NOx", "O3", "PM10", "PM25", "SO2"]
+years = range(2015, 2020)
+input_dir = station.cube_path()  # 測站立方體（3. fill missing.py 產生）；也可指定 4_interpolated_yearly_stationwise 舊格式寬表資料夾
+output_dir = './5_idw_validation'
+workers = os.cpu_count()
+
+# 搜尋的參數組合（目前使用 power=3、cutoff=300）
+powers = [1, 1.5, 2, 2.5, 3, 4, 5]
+cutoffs = [100, 150, 200, 300, 400, 600, 1000]
+
+# 子程序共用的唯讀資料，由 init_worker 設定
+_dis = None
+_values = None
+
+
+# 所有年份接在一起：(測站數, 總週數, 測項數)
+def load_all_years(sites):
+    cubes = []
+    for year in years:
+        values, dates, found = idw.load_factor_cube(input_dir, year, factors, sites)
+        if found != factors:
+            print(f"⚠️ {year} 年缺少測項：{sorted(set(factors) - set(found))}，跳過")
+            continue
+        cubes.append(values)
+    return np.concatenate(cubes, axis=1)
+
+
+def init_worker(dis, values):
+    global _dis, _values
+    _dis = dis
+    _values = values
+
+
+# 一組 (power, cutoff) 的各測項誤差；無法預測（範圍內沒有其他測站）的比例另外列出
+def evaluate(power, cutoff):
+    n_sites, n_weeks, n_factors = _values.shape
+    flat = _values.reshape(n_sites, n_weeks * n_factors)
+    pred = idw.loo_predict(_dis, flat, power, cutoff).reshape(_values.shape)
+
+    rows = []
+    for k, factor in enumerate(factors):
+        actual = _values[:, :, k]
+        err = pred[:, :, k] - actual
+        ok = ~np.isnan(err)
+        n_valid = int((~np.isnan(actual)).sum())
+        rows.append({
+            "factor": factor,
+            "power": power,
+            "cutoff": cutoff,
+            "RMSE": np.sqrt(np.mean(err[ok] ** 2)),
+            "MAE": np.mean(np.abs(err[ok])),
+            "n": int(ok.sum()),
+            "uncovered": 1 - ok.sum() / n_valid if n_valid else np.nan,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    site = idw.load_sites()
+    values = load_all_years(site['site'])
+    dis = idw.station_distances(site['lng'], site['lat'])
+    print(f"📂 共 {values.shape[0]} 站、{values.shape[1]} 週、{values.shape[2]} 個測項")
+
+    # 目前參數的留一驗證結果
+    init_worker(dis, values)
+    current = pd.DataFrame(evaluate(idw.POWER, idw.CUTOFF))
+    print(f"\n📊 目前參數 power={idw.POWER}、cutoff={idw.CUTOFF} 的留一驗證：")
+    print(current.round(3).to_string(index=False))
+
+    start = time.perf_counter()
+    combos = list(itertools.product(powers, cutoffs))
+    with mp.get_context("spawn").Pool(workers or None, initializer=init_worker, initargs=(dis, values)) as pool:
+        results = pool.starmap(evaluate, combos)
+    search = pd.DataFrame([row for rows in results for row in rows])
+    print(f"\n⏱️ {len(combos)} 組參數完成，共 {time.perf_counter() - start:.1f} 秒")
+
+    # 各測項 RMSE 最小的參數
+    best = search.loc[search.groupby("factor")["RMSE"].idxmin()]
+    print("\n🏆 各測項 RMSE 最小的參數：")
+    print(best.round(3).to_string(index=False))
+
+    os.makedirs(output_dir, exist_ok=True)
+    current.to_csv(os.path.join(output_dir, "loo_current.csv"), index=False, encoding="utf-8-sig")
+    search.to_csv(os.path.join(output_dir, "grid_search.csv"), index=False, encoding="utf-8-sig")
+    print(f"✅ 已輸出：{output_dir}")
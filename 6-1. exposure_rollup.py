@@ -0,0 +1,176 @@
+# 將IDW計算出的台灣空汙擴散圖彙整成鄉鎮、五大區域、群集三個層級的暴露量，取代原本的 6-1 鄉鎮、6-1 區域、6-2 整合三支程式
+# 每個測項的網格立方體只讀一次，先算出各鄉鎮的加總與權重，區域與群集再以分組矩陣由鄉鎮加總，結果與直接以網格計算相同
+# 每個層級輸出每個測項一個長表（層級, year, week, value）與所有測項一個寬表
+# source = "stream" 時不讀網格立方體，直接由測站資料做 IDW，逐塊送進區域統計，不寫出任何網格
+# statistic 可改用其他統計量（例如最大值的高峰週暴露），讀取該統計量的網格立方體或測站立方體，輸出資料夾加上統計量名稱
+import os
+
+import numpy as np
+import pandas as pd
+
+import boundary_helper as boundary
+import grid_helper as grid
+import idw_helper as idw
+import station_helper as station
+import zonal_helper as zonal
+
+# 測項清單（長表檔名沿用原本的 PM2.5，寬表欄位與 _with_ID 檔名為 PM25）
+factors = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
+years = range(2015, 2020)
+
+# 資料來源："cube" 讀取 5_grid_store 的網格立方體（5. inverse_weight16-19.ipynb 產生）；"stream" 由測站資料直接做 IDW，不需網格立方體
+source = "cube"
+statistic = station.DEFAULT_STATISTIC  # cube 模式讀取 grid.grid_store_dir(statistic)，立方體記錄的統計量不同時拒絕讀取
+input_dir = station.cube_path(statistic)  # 測站立方體（3. fill missing.py 產生）；也可指定 4_interpolated_yearly_stationwise 舊格式寬表資料夾
+
+# 網格大小：cube 模式須與 5_grid_store 相同（120）；stream 模式可用更細的網格（480 約 800 公尺、1200 約 300 公尺），記憶體只與分塊大小有關
+grid_size = 120
+
+# False: 只平均中心點落在鄉鎮內的網格（與原本 6-1 相同，小的區可能沒有網格）
+# True: 以網格與鄉鎮的重疊面積加權平均，每個鄉鎮都有值；鄉鎮數與數值都會改變，7、8-x、9 的結果須一併重新產生
+area_weighted = False
+
+# 群集結果（8-3. manual_to_single_file.py 產生，不存在時不輸出群集層級）
+cluster_path = "./8_clustering_result/PM25_cluster_2019.csv"
+cluster_name_map = {
+    1: "高屏",
+    2: "雲嘉南",
+    3: "苗中彰投",
+    4: "北北基桃竹",
+    5: "宜花東"
+}
+
+# 各層級的輸出資料夾與倍數（區域為週暴露量 = 每日平均 * 7）
+levels = {
+    "town": {"folder": station.with_statistic("6_exposure_by_town", statistic), "scale": 1},
+    "region": {"folder": station.with_statistic("6_exposure_by_region", statistic), "scale": 7},
+    "cluster": {"folder": station.with_statistic("6_exposure_by_cluster", statistic), "scale": 1},
+}
+
+
+# 各鄉鎮的群集編號，群集檔不存在時回傳 None
+# ID_CNAME.csv 的代碼保留前導 0（"0101"），8-x 輸出的群集檔為整數（101），兩邊都轉成整數再對應
+def load_town_clusters(town_ids):
+    if not os.path.exists(cluster_path):
+        print(f"⚠️ 找不到群集結果 {cluster_path}，不輸出群集層級")
+        return None
+    df_cluster = pd.read_csv(cluster_path)
+    cluster_map = df_cluster.set_index(pd.to_numeric(df_cluster["ID"]).astype("Int64"))["cluster"]
+    clusters = pd.to_numeric(town_ids).astype("Int64").map(cluster_map).astype("Int64")
+
+    missing = clusters.isna()
+    if missing.any():
+        print(f"⚠️ {missing.sum()} / {len(town_ids)} 個鄉鎮沒有群集編號，不計入群集層級："
+              f"{', '.join(town_ids[missing].fillna('(無代碼)').astype(str).head(10))}{' …' if missing.sum() > 10 else ''}")
+    return clusters
+
+
+# 串流模式：讀取某測項所有年份的測站資料，回傳 ((測站數, 週數), 每週的 year / week / date)；沒有任何檔案時回傳 (None, None)
+def load_station_years(column, sites):
+    values, layers = [], []
+    for year in years:
+        year_values, dates, found = idw.load_factor_cube(input_dir, year, [column], sites)
+        if not found:
+            continue
+        values.append(year_values[:, :, 0])
+        layers.extend({"year": year, "week": week, "date": date} for week, date in enumerate(dates, start=1))
+    if not values:
+        return None, None
+    return np.concatenate(values, axis=1), pd.DataFrame(layers)
+
+
+# 某測項各鄉鎮的 (加總, 權重, 每一層的 year / week)，加總與權重形狀為 (層數, 鄉鎮數)；沒有資料時回傳 None
+def factor_sums(factor, spec, coverage, site):
+    column = factor.replace('.', '')  # PM2.5 → PM25
+    if source == "stream":
+        values, layers = load_station_years(column, site['site'])
+        if values is None:
+            print(f"❌ 找不到測站資料: {factor}")
+            return None
+        tiles = idw.iter_idw_tiles(site['lng'], site['lat'], values, spec)
+        sums, weights = zonal.zonal_sums_tiled(tiles, coverage, spec.cols)
+    else:
+        cube, meta = grid.open_grid_cube(column, statistic)
+        if cube is None:
+            print(f"❌ 網格立方體不存在: {factor}（{statistic}，請先執行 5. inverse_weight16-19.ipynb）")
+            return None
+        if cube.shape[1:] != spec.shape:
+            print(f"⚠️ 網格大小不符：{factor} ({cube.shape[1:]} vs {spec.shape})")
+            return None
+        layers = pd.DataFrame(meta["weeks"])
+        sums, weights = zonal.zonal_sums(cube, coverage)
+
+    layers = layers.rename_axis("index").reset_index()
+    return sums, weights, layers[layers["year"].isin(years)]
+
+
+# 一個層級、一個測項的長表：只保留有有效網格的 (週, 組)
+def long_table(name, groups, means, weights, layers):
+    i, g = np.nonzero(weights[layers["index"].values] > 0)
+    return pd.DataFrame({
+        name: groups[g],
+        "year": layers["year"].values[i],
+        "week": layers["week"].values[i],
+        "value": np.round(means[layers["index"].values[i], g] * levels[name]["scale"], 2),
+    })
+
+
+if __name__ == "__main__":
+    # 網格與鄉鎮的對應（與 IDW 共用 grid_helper 的網格定義），快取於 zonal_cache/
+    spec = grid.GridSpec.with_size(grid_size)
+    site = idw.load_sites()
+    if area_weighted:
+        coverage, towns = zonal.coverage_matrix(spec)
+    else:
+        labels, towns = zonal.cell_towns(spec)
+        coverage = zonal.label_matrix(labels, len(towns))
+
+    # 鄉鎮 → 區域、鄉鎮 → 群集的分組矩陣（鄉鎮代碼與區域來自 boundary_helper 的鄉鎮圖層）
+    town_info = boundary.load_towns().drop_duplicates("town").set_index("town").reindex(towns)
+    town_ids = town_info["ID"].reset_index(drop=True)
+    group_matrices = {"region": zonal.group_matrix(town_info["region"].values)}
+    town_clusters = load_town_clusters(town_ids)
+    if town_clusters is not None:
+        group_matrices["cluster"] = zonal.group_matrix(town_clusters)
+
+    for name in levels:
+        if name == "town" or name in group_matrices:
+            os.makedirs(levels[name]["folder"], exist_ok=True)
+
+    wide = {name: [] for name in levels}
+    for factor in factors:
+        column = factor.replace('.', '')  # PM2.5 → PM25
+        factor_result = factor_sums(factor, spec, coverage, site)
+        if factor_result is None:
+            continue
+        sums, weights, layers = factor_result
+
+        # 鄉鎮的加總與權重以分組矩陣往上加總到區域、群集
+        results = {"town": (towns, sums, weights)}
+        for name, (G, groups) in group_matrices.items():
+            results[name] = (groups, *zonal.rollup(G, sums, weights))
+
+        for name, (groups, level_sums, level_weights) in results.items():
+            df = long_table(name, groups, zonal.weighted_mean(level_sums, level_weights), level_weights, layers)
+            folder = levels[name]["folder"]
+            df.to_csv(f"./{folder}/{factor}_weekly_exposure_by_{name}.csv", index=False, encoding="utf-8-sig")
+            wide[name].append(df.set_index([name, "year", "week"])["value"].rename(column))
+            print(f"✅ 輸出完成：{folder}/{factor}_weekly_exposure_by_{name}.csv（{len(df)} 筆）")
+
+        # 6-3、7、8-x、9 讀取的鄉鎮代碼版本（只含 ID_CNAME.csv 中有代碼的鄉鎮）
+        df = wide["town"][-1].reset_index()
+        df.insert(0, "ID", df["town"].map(dict(zip(towns, town_ids))))
+        df = df.dropna(subset=["ID"]).sort_values(["ID", "year", "week"])
+        df.to_csv(f"./{levels['town']['folder']}/{column}_weekly_exposure_with_ID.csv", index=False, encoding="utf-8-sig")
+
+    # 寬表：每個層級所有測項合併成一張（主鍵為 層級, year, week）
+    wide_names = {"town": "factors_weekly_exposure_by_town.csv", "region": "factors_weekly_exposure.csv", "cluster": "factors_weekly_exposure_by_cluster.csv"}
+    for name, columns in wide.items():
+        if not columns:
+            continue
+        df = pd.concat(columns, axis=1).reset_index().sort_values(by=[name, "year", "week"])
+        if name == "cluster":
+            df.insert(1, "region", df["cluster"].map(cluster_name_map))
+        output_path = f"./{levels[name]['folder']}/{wide_names[name]}"
+        df.to_csv(output_path, index=False, encoding="utf-8-sig")
+        print(f"✅ 最終輸出完成：{output_path}")
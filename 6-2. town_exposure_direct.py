@@ -0,0 +1,99 @@
+# 不經過網格，直接由測站以鄉鎮取樣點計算各鄉鎮的 IDW 暴露量
+# 取樣點對測站的權重先整理成 (鄉鎮數 × 測站數) 矩陣（依有效測站組合快取），每個測項所有週只需一次矩陣乘法
+# 輸出格式與 6-1. exposure_rollup.py 的鄉鎮長表相同，並與其結果比較
+# statistic 可改用其他統計量（例如最大值），輸出與比較對象的資料夾加上統計量名稱
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import idw_helper as idw
+import station_helper as station
+import zonal_helper as zonal
+
+factors = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
+years = range(2015, 2020)
+statistic = station.DEFAULT_STATISTIC
+input_dir = station.cube_path(statistic)  # 測站立方體（3. fill missing.py 產生）；也可指定 4_interpolated_yearly_stationwise 舊格式寬表資料夾
+
+# 取樣方式："grid" 鄉鎮內的網格點、"centroid" 每鄉鎮一個代表點、"subgrid" 每鄉鎮外框內 subgrid_n × subgrid_n 的規則點
+method = "grid"
+subgrid_n = 5
+
+output_folder = station.with_statistic("6_exposure_by_town_direct", statistic)
+
+# 比較對象：6-1. exposure_rollup.py 以網格計算的鄉鎮暴露量
+# grid_area_weighted 須與產生該結果時 6-1 的 area_weighted 相同；method = "grid" 且為 False 時兩邊都只用中心點落在鄉鎮內的網格
+grid_folder = station.with_statistic("6_exposure_by_town", statistic)
+grid_area_weighted = False
+
+
+# 兩邊的鄉鎮彙整方式，列在比較結果中；不同時差異也包含彙整方式造成的部分
+def compare_rule():
+    grid_rule = "面積加權" if grid_area_weighted else "中心點"
+    same = method == "grid" and not grid_area_weighted
+    return f"直接法 {method} 取樣 vs 網格版 {grid_rule}（{'相同' if same else '不同'}彙整方式）"
+
+
+# 與網格版的鄉鎮長表比較（只比較兩邊都有值的 鄉鎮 × 週）
+def compare_with_grid(factor, df):
+    grid_path = f"./{grid_folder}/{factor}_weekly_exposure_by_town.csv"
+    if not os.path.exists(grid_path):
+        print(f"⚠️ 找不到網格版結果，略過比較：{grid_path}")
+        return None
+
+    merged = df.merge(pd.read_csv(grid_path), on=["town", "year", "week"], suffixes=("_direct", "_grid"))
+    diff = merged["value_direct"] - merged["value_grid"]
+    return {
+        "factor": factor,
+        "rows": len(merged),
+        "MAE": round(diff.abs().mean(), 3),
+        "max_abs": round(diff.abs().max(), 3),
+        "corr": round(merged["value_direct"].corr(merged["value_grid"]), 4),
+    }
+
+
+if __name__ == "__main__":
+    site = idw.load_sites()
+    px, py, point_town, towns = zonal.town_sample_points(method, n=subgrid_n)
+    W = idw.point_weight_matrix(site['lng'], site['lat'], px, py)
+    cache = idw.TownWeightCache(W, point_town, len(towns))
+    print(f"📍 {method} 取樣：{len(towns)} 個鄉鎮、{len(px)} 個取樣點")
+
+    os.makedirs(output_folder, exist_ok=True)
+    checks = []
+    for factor in factors:
+        column = factor.replace('.', '')  # PM2.5 → PM25
+        start = time.perf_counter()
+
+        results = []
+        for year in years:
+            values, dates, found = idw.load_factor_cube(input_dir, year, [column], site['site'])
+            if not found:
+                continue
+            exposure = idw.idw_towns(cache, values[:, :, 0])  # (鄉鎮數, 週數)
+
+            week, town = np.nonzero(~np.isnan(exposure.T))
+            results.append(pd.DataFrame({
+                "town": towns[town],
+                "year": year,
+                "week": week + 1,
+                "value": np.round(exposure.T[week, town], 2),
+            }))
+
+        if not results:
+            print(f"⚠️ 無任何有效結果輸出：{factor}")
+            continue
+        df = pd.concat(results, ignore_index=True)
+        df.to_csv(f"./{output_folder}/{factor}_weekly_exposure_by_town.csv", index=False, encoding="utf-8-sig")
+        print(f"✅ 輸出完成：{factor}_weekly_exposure_by_town.csv（{len(df)} 筆，{time.perf_counter() - start:.2f} 秒）")
+
+        check = compare_with_grid(factor, df)
+        if check is not None:
+            checks.append(check)
+
+    print(f"🧮 權重快取：{cache.info()}")
+    if checks:
+        print(f"\n📊 與網格版鄉鎮暴露量比較：{compare_rule()}")
+        print(pd.DataFrame(checks).to_string(index=False))
@@ -1,4 +1,4 @@
-# 將6. inverse_weight2cluster.py的結果轉換為以疾病區分的資料，並以統計出來的就診人數、區域人數計算出就診人數比例
+# 將6-1. exposure_rollup.py的區域層級結果轉換為以疾病區分的資料，並以統計出來的就診人數、區域人數計算出就診人數比例
 import pandas as pd
 import os
 
@@ -1,8 +1,8 @@
 # 繪製2016年第45周的PM2.5暴露情況做確認
 import pandas as pd
-import geopandas as gpd
 import matplotlib.pyplot as plt
-from shapely.geometry import box
+
+import boundary_helper as boundary
 
 # 設定中文字體
 plt.rcParams['font.sans-serif'] = ['Microsoft JhengHei', 'SimHei', 'Microsoft YaHei', 'STHeiti']
@@ -10,21 +10,14 @@ plt.rcParams['axes.unicode_minus'] = False
 
 # === 1️⃣ 讀取資料 ===
 csv_path = "./6_exposure_by_town/PM25_weekly_exposure_with_ID.csv"
-gml_path = "./TOWN_MOI_1131028.gml"
 
 df = pd.read_csv(csv_path)
 df_2016w45 = df[(df["year"] == 2016) & (df["week"] == 45) & (df["PM25"].notna())]
 print(f"共有 {len(df_2016w45)} 個鄉鎮有有效資料")
 
-# === 2️⃣ 讀取鄉鎮邊界 ===
-taiwan_map = gpd.read_file(gml_path)
-taiwan_map = taiwan_map.set_crs("EPSG:3824").to_crs("EPSG:4326")
-taiwan_map = taiwan_map.rename(columns={"名稱": "town"})
-
-# === 3️⃣ 只保留台灣本島 ===
-# 定義台灣主島的經緯度邊界（排除澎湖、金門、馬祖）
-main_island_bounds = box(119.9, 21.8, 122.1, 25.5)
-taiwan_main = taiwan_map[taiwan_map.intersects(main_island_bounds)].copy()
+# === 2️⃣ 讀取鄉鎮邊界（boundary_helper 快取，已轉成 EPSG:4326） ===
+# === 3️⃣ 只保留台灣本島（排除澎湖、金門、馬祖） ===
+taiwan_main = boundary.main_island()
 
 # === 4️⃣ 合併空間資料 ===
 map_with_data = taiwan_main.merge(df_2016w45, on="town", how="inner")
@@ -4,9 +4,10 @@ import pandas as pd
 import geopandas as gpd
 import matplotlib.pyplot as plt
 from sklearn.cluster import KMeans
-from shapely.geometry import box
 from matplotlib.patches import Patch
 
+import boundary_helper as boundary
+
 # 程式跳出的警告不影響執行
 # 1. Could not find the number of physical cores = joblib 嘗試用 wmic 指令查核心數，但新版 Windows 不再預設包含這個工具
 # 2. KMeans is known to have a memory leak on Windows with MKL = Windows + MKL + 多執行緒的組合下有已知記憶體洩漏
@@ -21,18 +22,11 @@ os.makedirs(output_folder, exist_ok=True)
 
 # === 1️⃣ 載入資料 ===
 csv_path = "./6_exposure_by_town/PM25_weekly_exposure_with_ID.csv"
-gml_path = "./TOWN_MOI_1131028.gml"
 
 df = pd.read_csv(csv_path)
 
-# === 2️⃣ 讀取並轉換鄉鎮邊界 ===
-taiwan_map = gpd.read_file(gml_path)
-taiwan_map = taiwan_map.set_crs("EPSG:3824").to_crs("EPSG:4326")
-taiwan_map = taiwan_map.rename(columns={"名稱": "town"})
-
-# 移除離島（澎湖、金門、馬祖）
-main_island_bounds = box(119.9, 21.8, 122.1, 25.5)
-taiwan_main = taiwan_map[taiwan_map.intersects(main_island_bounds)].copy()
+# === 2️⃣ 讀取鄉鎮邊界（boundary_helper 快取，已轉成 EPSG:4326），移除離島（澎湖、金門、馬祖） ===
+taiwan_main = boundary.main_island()
 
 # === 3️⃣ 定義顏色（由高到低） ===
 # colors_hex = ["#AA04AA", "#FF0000", "#FFA500", "#FFFF00", "#23B623"]
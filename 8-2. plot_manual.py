@@ -3,9 +3,10 @@ import os
 import pandas as pd
 import geopandas as gpd
 import matplotlib.pyplot as plt
-from shapely.geometry import box
 from matplotlib.patches import Patch
 
+import boundary_helper as boundary
+
 # 設定中文字體
 plt.rcParams['font.sans-serif'] = ['Microsoft JhengHei', 'SimHei', 'Microsoft YaHei', 'STHeiti']
 plt.rcParams['axes.unicode_minus'] = False
@@ -17,15 +18,8 @@ os.makedirs(output_folder, exist_ok=True)
 # 顏色設定（高→低）
 colors_hex = ["#AA04AA", "#FF0000", "#FFA500", "#FFFF00", "#23B623"]
 
-# 讀取鄉鎮邊界
-gml_path = "./TOWN_MOI_1131028.gml"
-taiwan_map = gpd.read_file(gml_path)
-taiwan_map = taiwan_map.set_crs("EPSG:3824").to_crs("EPSG:4326")
-taiwan_map = taiwan_map.rename(columns={"名稱": "town"})
-
-# 移除離島（澎湖、金門、馬祖）
-main_island_bounds = box(119.9, 21.8, 122.1, 25.5)
-taiwan_main = taiwan_map[taiwan_map.intersects(main_island_bounds)].copy()
+# 讀取鄉鎮邊界（boundary_helper 快取，已轉成 EPSG:4326），移除離島（澎湖、金門、馬祖）
+taiwan_main = boundary.main_island()
 
 # === 讀取手動分群結果 ===
 manual_folder = output_folder
@@ -3,9 +3,10 @@ import pandas as pd
 import geopandas as gpd
 import matplotlib.pyplot as plt
 from sklearn.cluster import KMeans
-from shapely.geometry import box
 from matplotlib.patches import Patch
 
+import boundary_helper as boundary
+
 # 設定中文字體
 plt.rcParams['font.sans-serif'] = ['Microsoft JhengHei', 'SimHei', 'Microsoft YaHei', 'STHeiti']
 plt.rcParams['axes.unicode_minus'] = False
@@ -16,18 +17,11 @@ os.makedirs(output_folder, exist_ok=True)
 
 # === 1️⃣ 🚀 改成讀取五年平均檔案 ===
 csv_path = "./6_exposure_by_town/PM25_5year_mean.csv"   # <── 改這裡
-gml_path = "./TOWN_MOI_1131028.gml"
 
 df = pd.read_csv(csv_path)
 
-# === 2️⃣ 讀取鄉鎮邊界 ===
-taiwan_map = gpd.read_file(gml_path)
-taiwan_map = taiwan_map.set_crs("EPSG:3824").to_crs("EPSG:4326")
-taiwan_map = taiwan_map.rename(columns={"名稱": "town"})
-
-# 移除離島
-main_island_bounds = box(119.9, 21.8, 122.1, 25.5)
-taiwan_main = taiwan_map[taiwan_map.intersects(main_island_bounds)].copy()
+# === 2️⃣ 讀取鄉鎮邊界（boundary_helper 快取，已轉成 EPSG:4326），移除離島 ===
+taiwan_main = boundary.main_island()
 
 # === 3️⃣ 定義顏色（由高到低） ===
 colors_hex = ["#AA04AA", "#FF0000", "#FFA500", "#FFFF00", "#23B623"]
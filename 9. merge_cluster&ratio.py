@@ -1,12 +1,11 @@
-# 把就診比例資料(周就診轉比例)和空汙資料(6_exposure_by_town)合併
+# 把就診比例資料(周就診轉比例)和空汙資料(6_exposure_by_cluster)合併
 # 然後使用PM25_manual_cluster_2019.csv把就診比例資料換算成以大區域為單位的
 import os
 import pandas as pd
-from functools import reduce
 
 # === 1️⃣ 檔案路徑設定 ===
 disease_folder = "./周就醫轉比例"
-exposure_folder = "./6_exposure_by_town"
+exposure_path = "./6_exposure_by_cluster/factors_weekly_exposure_by_cluster.csv"
 cluster_path = "./8_clustering_result/PM25_cluster_2019.csv"
 output_folder = "./9_disease_with_exposure"
 os.makedirs(output_folder, exist_ok=True)
@@ -15,45 +14,14 @@ os.makedirs(output_folder, exist_ok=True)
 df_cluster = pd.read_csv(cluster_path)
 df_cluster["ID"] = df_cluster["ID"].astype(str)
 
-cluster_name_map = {
-    1: "高屏",
-    2: "雲嘉南",
-    3: "苗中彰投",
-    4: "北北基桃竹",
-    5: "宜花東"
-}
-
-# === 3️⃣ 自動讀取並合併所有污染物檔案 ===
-pollutant_dfs = []
-for file in os.listdir(exposure_folder):
-    if not file.endswith("_weekly_exposure_with_ID.csv"):
-        continue
-
-    pollutant_name = file.split("_")[0]  # 取 "NO"、"NO2"、"PM25" 等
-    df = pd.read_csv(os.path.join(exposure_folder, file))
-    df["ID"] = df["ID"].astype(str)
-    df = df.rename(columns={pollutant_name: pollutant_name.upper()})
-    pollutant_dfs.append(df[["ID", "year", "week", pollutant_name.upper()]])
-
-# 合併成一張總表
-df_expo = reduce(lambda left, right: pd.merge(left, right, on=["ID", "year", "week"], how="outer"), pollutant_dfs)
-
-# 合併 cluster
-df_expo = df_expo.merge(df_cluster, on="ID", how="left")
-
-# === 4️⃣ 依群、年、週計算平均 ===
-pollutants = [c for c in df_expo.columns if c in ["NO", "NO2", "NOX", "O3", "PM10", "PM25", "SO2"]]
-
-df_expo_grouped = (
-    df_expo.groupby(["year", "week", "cluster"], as_index=False)[pollutants]
-    .mean()
-)
-df_expo_grouped[pollutants] = df_expo_grouped[pollutants].round(2)
-df_expo_grouped["region"] = df_expo_grouped["cluster"].map(cluster_name_map)
+# === 3️⃣ 讀取群集平均空污（6-1. exposure_rollup.py 由鄉鎮加總到群集，依網格面積加權，已含 region 名稱） ===
+df_expo_grouped = pd.read_csv(exposure_path)
+df_expo_grouped = df_expo_grouped.rename(columns={"NOx": "NOX"})
+pollutants = [c for c in df_expo_grouped.columns if c in ["NO", "NO2", "NOX", "O3", "PM10", "PM25", "SO2"]]
 
-print("✅ 空污群平均計算完成，共", len(df_expo_grouped), "筆")
+print("✅ 空污群平均讀取完成，共", len(df_expo_grouped), "筆")
 
-# === 5️⃣ 整合疾病資料 ===
+# === 4️⃣ 整合疾病資料 ===
 for file in os.listdir(disease_folder):
     if not file.endswith("_filtered.csv"):
         continue
@@ -1,4 +1,11 @@
 import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# 120x120 網格的陸地遮罩（原本寫在 is_in_area 裡的 truthtable），其他網格定義可用 grid_helper.save_land_mask 依鄉鎮邊界重新產生
+LAND_MASK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "land_mask_120x120.npy")
 
 
 # def calc_idw_value(unknowncell, knowncells):
@@ -45,966 +52,13 @@ import math
 #     return cmap[-index]
 
 
+# 陸地遮罩（列由北往南、欄由西往東），整個程式只讀一次，回傳唯讀的 bool 陣列
+@lru_cache(maxsize=None)
+def land_mask(path=LAND_MASK_PATH):
+    mask = np.load(path).astype(bool)
+    mask.setflags(write=False)
+    return mask
+
+
 def is_in_area(x, y):
-    truthtable = [
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, False, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, True,
-         True, True, True, False, True, True, True, True, True, True, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, True, True,
-         True, True, True, True, False, True, True, False, False, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, True, True, True, True,
-         True, True, False, True, False, False, True, True, False, True, True, False, False, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False,
-         True, False, False, False, True, False, False, True, True, True, True, False, False, False, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, True, False, True, True, True, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, False, True, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, False, False, False, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, False, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, False, True, True, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, False, True, False, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, False, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, False, False, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         False, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, False, False, True, True, False, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, True, False, True, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, False, False, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, True, True, False, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, True, False, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, True, True, True, True, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, False, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         False, False, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, False, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, False, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, False, False, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, False, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, False, False, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, False, False, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, False, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, False, False, False, False, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, False, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, False, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, True, True, True, True, True, True, True, True, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, True, True, False, False, False, False, False, False, False, False, True,
-         True, False, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, False, False,
-         False, True, False, True, True, True, True, True, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False, False,
-         True, False, True, True, True, True, True, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, True, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, True, True, False, False, False, False, False, False, False, True, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, True, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, True, True, False, True, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, True, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, True, True, True, True, True,
-         True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True,
-         True, True, True, True, True, True, True, False, False, False, False, False, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, True, True, True, True, True, True, True,
-         True, True, True, True, True, False, True, True, False, False, False, True, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, True, True,
-         True, True, True, True, True, True, False, False, False, False, False, False, True, True, True, True, True,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, True, True, True,
-         True, True, True, True, True, True, True, True, True, False, False, True, False, True, True, True, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True,
-         True, True, True, True, True, True, True, True, True, False, False, True, False, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, True, True, True, True, True, True, True, False, False, False, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, True, False, False,
-         False, False, False, True, True, True, False, True, False, False, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False,
-         False, False, False, False, True, True, False, True, True, False, False, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, True, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, True, False, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         True, True, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, True, True, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, True, True, True, True, True, True, True, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, True, True, True, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, True, True, True, False, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, True, False, False, True, True, True, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False],
-        [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False,
-         False, False, False, False, False, False, False, False]]
-    return truthtable[x][y]
+    return bool(land_mask()[x, y])
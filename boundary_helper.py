@@ -0,0 +1,87 @@
+# 鄉鎮邊界圖層：讀取 GML 並轉成 EPSG:4326 只做一次，結果存成 GeoParquet，之後所有需要邊界的程式都從這裡讀取
+# 邊界檔內容改變時（雜湊不同）自動重建
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+import ingest_helper as ingest
+
+# 鄉鎮邊界檔（TWD67 經緯度 EPSG:3824）與快取資料夾
+BOUNDARY_PATH = "TOWN_MOI_1131028.gml"
+CACHE_DIR = "boundary_cache"
+
+# 鄉鎮代碼對照（C_NAME → ID1_CITY）
+ID_PATH = "ID_CNAME.csv"
+
+# 台灣本島的經緯度範圍（排除澎湖、金門、馬祖），與 7、8-x 地圖的顯示範圍相同
+MAIN_ISLAND_BOUNDS = (119.9, 21.8, 122.1, 25.5)
+
+# 繪圖用簡化邊界的容許誤差（度，約 100 公尺）
+SIMPLIFY_TOLERANCE = 0.001
+
+# 定義縣市對應區域
+REGION_MAP = {
+    '北北基桃竹苗': ['臺北市', '新北市', '基隆市', '桃園市', '新竹市', '新竹縣', '苗栗縣'],
+    '中彰投': ['臺中市', '彰化縣', '南投縣'],
+    '雲嘉南': ['雲林縣', '嘉義市', '嘉義縣', '臺南市'],
+    '高屏': ['高雄市', '屏東縣'],
+    '宜花東': ['宜蘭縣', '花蓮縣', '臺東縣']
+}
+
+
+def assign_region(county):
+    for region, counties in REGION_MAP.items():
+        if any(c in county for c in counties):
+            return region
+    return '其他'
+
+
+# 讀取 GML 並整理欄位：town（名稱，含縣市）、ID、county、region、main_island、geometry、render_geometry（繪圖用簡化邊界）
+def build_towns(path=BOUNDARY_PATH):
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    towns = gpd.read_file(path).set_crs("EPSG:3824", allow_override=True).to_crs("EPSG:4326")
+    towns = towns.rename(columns={"名稱": "town"})
+
+    if os.path.exists(ID_PATH):
+        town_ids = pd.read_csv(ID_PATH, dtype=str).set_index("C_NAME")["ID1_CITY"]
+        towns["ID"] = towns["town"].map(town_ids)
+    else:
+        towns["ID"] = None
+    towns["county"] = towns["town"].str[:3]
+    towns["region"] = towns["town"].apply(assign_region)
+    towns["main_island"] = towns.intersects(box(*MAIN_ISLAND_BOUNDS))
+    towns["render_geometry"] = towns.geometry.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+    return towns
+
+
+# 鄉鎮邊界圖層（EPSG:4326），快取於 boundary_cache/，同一程序內只讀一次
+# geometry 已 prepare，contains / intersects 等判斷可直接使用；回傳的圖層請勿直接修改，需要時先 .copy()
+@lru_cache(maxsize=4)
+def load_towns(path=BOUNDARY_PATH, cache_dir=CACHE_DIR):
+    import geopandas as gpd
+    import shapely
+
+    cache_path = os.path.join(cache_dir, f"towns_{ingest.file_hash(path)[:16]}.parquet")
+    if os.path.exists(cache_path):
+        towns = gpd.read_parquet(cache_path)
+    else:
+        towns = build_towns(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        towns.to_parquet(cache_path + ".tmp")
+        os.replace(cache_path + ".tmp", cache_path)
+        print(f"💾 已建立鄉鎮邊界快取：{cache_path}（{len(towns)} 個鄉鎮）")
+
+    shapely.prepare(towns.geometry.values)
+    return towns
+
+
+# 台灣本島的鄉鎮，geometry 換成繪圖用的簡化邊界（render=False 時維持原始邊界）
+def main_island(render=True, path=BOUNDARY_PATH):
+    towns = load_towns(path)
+    taiwan_main = towns[towns["main_island"]].copy()
+    if render:
+        taiwan_main["geometry"] = taiwan_main["render_geometry"]
+    return taiwan_main.drop(columns="render_geometry")
@@ -0,0 +1,176 @@
+# 缺值與補值的共用工具：以布林陣列的 run-length 一次算出所有 測站 × 測項 的缺值段落，不逐欄 groupby
+# 缺值遮罩以 np.packbits 壓縮存檔（每週 1 bit），2. missing detect.py 寫出、3. fill missing.py 讀取
+import os
+
+import numpy as np
+import pandas as pd
+
+import station_helper as station
+
+# 缺值普查的輸出資料夾：2_missing_census/<資料庫>[_<統計量>]/
+CENSUS_DIR = "2_missing_census"
+
+
+# 沿最後一軸找出所有連續 True 的段落：回傳 (所在列, 開始位置, 長度)，列為前面各軸攤平後的索引
+def true_runs(mask):
+    mask = np.asarray(mask, dtype=bool)
+    flat = mask.reshape(-1, mask.shape[-1])
+    padded = np.zeros((flat.shape[0], flat.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = flat
+    step = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(step == 1)
+    _, ends = np.nonzero(step == -1)
+    return rows, starts, ends - starts
+
+
+# 沿最後一軸的缺值統計：(缺值數, 最長連續缺值, 最長段落開始位置, 結束位置)，形狀為 mask.shape[:-1]
+# 沒有缺值時最長為 0、開始與結束為 -1；有多段一樣長時取最早的一段
+def gap_stats(mask):
+    mask = np.asarray(mask, dtype=bool)
+    shape = mask.shape[:-1]
+    n = int(np.prod(shape))
+    rows, starts, lengths = true_runs(mask)
+
+    longest = np.zeros(n, dtype=int)
+    start = np.full(n, -1)
+    if len(rows):
+        # 每列依長度由大到小、開始位置由小到大排序，取第一段
+        order = np.lexsort((starts, -lengths, rows))
+        first = order[np.r_[True, rows[order][1:] != rows[order][:-1]]]
+        longest[rows[first]] = lengths[first]
+        start[rows[first]] = starts[first]
+    end = np.where(longest > 0, start + longest - 1, -1)
+
+    count = mask.reshape(n, -1).sum(axis=1)
+    return tuple(a.reshape(shape) for a in (count, longest, start, end))
+
+
+# 沿最後一軸的最長連續缺值長度
+def max_gap(mask):
+    return gap_stats(mask)[1]
+
+
+# 沿最後一軸的線性內插，所有列一次計算（與 pandas interpolate(method="linear", limit_direction="both") 相同）
+# 兩端的缺值以最近的有效值補上；整列皆為缺值的列維持 NaN；位置以索引計，不考慮日期間隔
+def fill_linear(values):
+    values = np.asarray(values, dtype=float)
+    flat = values.reshape(-1, values.shape[-1])
+    valid = ~np.isnan(flat)
+    positions = np.broadcast_to(np.arange(flat.shape[1]), flat.shape)
+
+    # 每個位置前一個與後一個有效值的位置（沒有時為 -1 / 欄數）
+    prev_idx = np.maximum.accumulate(np.where(valid, positions, -1), axis=1)
+    next_idx = np.minimum.accumulate(np.where(valid, positions, flat.shape[1])[:, ::-1], axis=1)[:, ::-1]
+    has_prev = prev_idx >= 0
+    has_next = next_idx < flat.shape[1]
+
+    rows = np.arange(flat.shape[0])[:, None]
+    prev_val = flat[rows, np.clip(prev_idx, 0, None)]
+    next_val = flat[rows, np.clip(next_idx, None, flat.shape[1] - 1)]
+
+    # 與 np.interp 相同的計算順序：slope * (x - xp) + fp
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = (next_val - prev_val) / (next_idx - prev_idx)
+        between = slope * (positions - prev_idx) + prev_val
+    filled = np.where(has_prev & has_next, between, np.where(has_prev, prev_val, next_val))
+    filled = np.where(valid, flat, np.where(has_prev | has_next, filled, np.nan))
+    return filled.reshape(values.shape)
+
+
+# 測站兩兩之間的相關與迴歸係數，只用兩站同時有值的週：values 為 (測站數, 週數)
+# 回傳 (相關係數, 重疊週數, 截距, 斜率)，皆為 (測站數, 測站數)；[i, j] 為以測站 j 預測測站 i 的 i = 截距 + 斜率 * j
+def pairwise_regression(values):
+    mask = ~np.isnan(values)
+    x = np.where(mask, values, 0.0)
+    m = mask.astype(float)
+
+    n = m @ m.T                 # 重疊週數
+    sum_i = x @ m.T             # [i, j]：重疊週 i 的總和
+    sum_j = sum_i.T             # [i, j]：重疊週 j 的總和
+    sq_i = (x * x) @ m.T
+    sq_j = sq_i.T
+    cross = x @ x.T
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = n * cross - sum_i * sum_j
+        var_i = n * sq_i - sum_i ** 2
+        var_j = n * sq_j - sum_j ** 2
+        corr = cov / np.sqrt(var_i * var_j)
+        slope = cov / var_j
+        intercept = (sum_i - slope * sum_j) / n
+    return corr, n, intercept, slope
+
+
+# 每個測站相關最高的 k 個鄰近測站（相關係數 >= min_corr 且重疊週數 >= min_overlap），不足 k 個時以 -1 補位
+# 回傳 dict：neighbors (測站數, k) 測站索引、weight 以相關係數平方為權重、intercept / slope 迴歸係數
+def neighbor_index(values, k=3, min_corr=0.6, min_overlap=52):
+    corr, n, intercept, slope = pairwise_regression(values)
+    usable = (corr >= min_corr) & (n >= min_overlap) & ~np.eye(len(values), dtype=bool)
+    score = np.where(usable, corr, -np.inf)
+
+    neighbors = np.argsort(-score, axis=1, kind="stable")[:, :k]
+    rows = np.arange(len(values))[:, None]
+    ok = np.isfinite(score[rows, neighbors])
+    return {
+        "neighbors": np.where(ok, neighbors, -1),
+        "weight": np.where(ok, corr[rows, neighbors] ** 2, 0.0),
+        "intercept": np.where(ok, intercept[rows, neighbors], 0.0),
+        "slope": np.where(ok, slope[rows, neighbors], 0.0),
+    }
+
+
+# 以鄰近測站的迴歸預測補缺值：values 為 (測站數, 週數)，測站順序須與 neighbor_index 相同
+# 各鄰近測站的預測以權重平均（只用該週有值的鄰近測站），所有測站與週一次計算；沒有可用鄰近測站的位置維持 NaN
+def fill_from_neighbors(values, index):
+    neighbors = index["neighbors"]
+    x = values[np.clip(neighbors, 0, None)]                         # (測站數, k, 週數)
+    pred = index["intercept"][:, :, None] + index["slope"][:, :, None] * x
+    w = np.where((neighbors[:, :, None] >= 0) & ~np.isnan(x), index["weight"][:, :, None], 0.0)
+
+    total = w.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        estimate = np.where(w > 0, pred * w, 0.0).sum(axis=1) / total
+    return np.where(np.isnan(values) & (total > 0), estimate, values)
+
+
+# 某資料庫、某統計量的普查資料夾，例如 2_missing_census/1_station_store_最大值
+def census_dir(store_dir, statistic=station.DEFAULT_STATISTIC):
+    return os.path.join(CENSUS_DIR, station.with_statistic(os.path.basename(os.path.normpath(store_dir)), statistic))
+
+
+# 某年份分區的缺值遮罩路徑
+def mask_path(store_dir, year, statistic=station.DEFAULT_STATISTIC):
+    return os.path.join(census_dir(store_dir, statistic), f"missing_mask_{int(year)}.npz")
+
+
+# 缺值遮罩存檔：(測站數, 週數, 測項數) 布林陣列沿週壓縮成位元，附上測站、日期、測項標籤（先寫暫存檔再改名）
+def save_mask(path, mask, stations, dates, factors):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(
+        tmp,
+        bits=np.packbits(mask, axis=1),
+        n_weeks=mask.shape[1],
+        stations=np.asarray(stations, dtype=str),
+        dates=np.asarray(pd.DatetimeIndex(dates).strftime("%Y-%m-%d"), dtype=str),
+        factors=np.asarray(factors, dtype=str),
+    )
+    os.replace(tmp, path)
+
+
+# 讀取缺值遮罩，回傳 (遮罩, 測站, 日期, 測項)
+def load_mask(path):
+    with np.load(path) as data:
+        mask = np.unpackbits(data["bits"], axis=1, count=int(data["n_weeks"])).astype(bool)
+        return mask, data["stations"], pd.DatetimeIndex(data["dates"]), list(data["factors"])
+
+
+# 讀取缺值遮罩並依 stations、dates、factors 的順序重排成 (測站數, 週數, 測項數)；有任何標籤不在遮罩中時回傳 None
+def aligned_mask(path, stations, dates, factors):
+    mask, mask_stations, mask_dates, mask_factors = load_mask(path)
+    s = pd.Index(mask_stations).get_indexer(stations)
+    d = mask_dates.get_indexer(pd.DatetimeIndex(dates))
+    f = pd.Index(mask_factors).get_indexer(factors)
+    if (s < 0).any() or (d < 0).any() or (f < 0).any():
+        return None
+    return mask[np.ix_(s, d, f)]
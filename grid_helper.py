@@ -0,0 +1,212 @@
+# 網格定義與網格資料存取：每個測項一個 float32 網格立方體（年週 × 列 × 欄，.npy）加上 metadata（.json），以 memmap 開啟供區域統計直接切片
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import aqi_helper as helper
+import boundary_helper as boundary
+import station_helper as station
+
+# 鄉鎮邊界檔（產生陸地遮罩用）
+BOUNDARY_PATH = boundary.BOUNDARY_PATH
+
+# 網格立方體存放位置與無資料值（不在陸地或 300 範圍內無測站的網格）
+# 平均值存於 5_grid_store/，其他統計量另加統計量名稱（station.with_statistic），例如 5_grid_store_最大值/
+GRID_STORE_DIR = "5_grid_store"
+NODATA = -1
+
+# 非預設網格的陸地遮罩快取資料夾
+CACHE_DIR = "grid_cache"
+
+
+# 網格定義：列數、欄數與經緯度範圍，IDW 插值與 6-x 區域統計共用
+# 列由北往南（lat_max → lat_min）、欄由西往東（lng_min → lng_max），網格點在每格的西北角
+@dataclass(frozen=True)
+class GridSpec:
+    rows: int = 120
+    cols: int = 120
+    lng_min: float = 119
+    lng_max: float = 122.7
+    lat_min: float = 21.8
+    lat_max: float = 25.5
+
+    # 同樣範圍、n x n 的網格（120 約 3 公里、480 約 800 公尺、1200 約 300 公尺）
+    @classmethod
+    def with_size(cls, n):
+        return cls(rows=n, cols=n)
+
+    @classmethod
+    def from_meta(cls, meta):
+        bounds = meta["bounds"]
+        return cls(rows=meta["shape"][1], cols=meta["shape"][2], **bounds)
+
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def n_cells(self):
+        return self.rows * self.cols
+
+    @property
+    def lng_step(self):
+        return (self.lng_max - self.lng_min) / self.cols
+
+    @property
+    def lat_step(self):
+        return (self.lat_max - self.lat_min) / self.rows
+
+    # 快取檔名用的識別字串
+    def key(self):
+        return f"{self.rows}x{self.cols}_{self.lng_min}_{self.lng_max}_{self.lat_min}_{self.lat_max}"
+
+    # 每列的緯度、每欄的經度
+    def coords(self):
+        lngs = np.arange(self.lng_min, self.lng_max, self.lng_step)[:self.cols]
+        lats = np.arange(self.lat_max, self.lat_min, -self.lat_step)[:self.rows]
+        return lngs, lats
+
+    # 所有網格點的經緯度，依列優先展開（與網格 .ravel() 的順序相同）
+    def points(self):
+        lngs, lats = self.coords()
+        xx, yy = np.meshgrid(lngs, lats)
+        return xx.ravel(), yy.ravel()
+
+    def to_meta(self):
+        return {
+            "bounds": {"lng_min": self.lng_min, "lng_max": self.lng_max, "lat_min": self.lat_min, "lat_max": self.lat_max},
+            "resolution": {"lng": self.lng_step, "lat": self.lat_step},
+        }
+
+    # 陸地遮罩 (列, 欄)，見 land_mask()
+    def land_mask(self):
+        return land_mask(self)
+
+
+# 預設 120x120 網格（原本寫死在筆記本與 6-1、6-2 的 (122.7-119)/120、(25.5-21.8)/120）
+DEFAULT_GRID = GridSpec()
+
+
+# 依鄉鎮邊界產生陸地遮罩：網格點落在任一鄉鎮多邊形內為 True，形狀為 (列, 欄)
+# geopandas 只在重建遮罩時才需要
+def build_land_mask(gml_path=BOUNDARY_PATH, spec=DEFAULT_GRID):
+    import shapely
+
+    towns = boundary.load_towns(gml_path)
+    land = shapely.union_all(towns.geometry.values)
+    shapely.prepare(land)
+    lngs, lats = spec.points()
+    return shapely.contains_xy(land, lngs, lats).reshape(spec.shape)
+
+
+# 產生陸地遮罩並存成 .npy，供 aqi_helper.land_mask 讀取
+def save_land_mask(path, gml_path=BOUNDARY_PATH, spec=DEFAULT_GRID):
+    mask = build_land_mask(gml_path, spec)
+    np.save(path, mask)
+    print(f"💾 已產生陸地遮罩：{path} {mask.shape}，陸地網格 {int(mask.sum())} 格")
+    return mask
+
+
+# 將預設 120x120 遮罩以最近鄰取樣到其他網格（沒有鄉鎮邊界檔時的替代做法）
+def resample_default_mask(spec):
+    lngs, lats = spec.coords()
+    cols = np.clip(np.floor((lngs - DEFAULT_GRID.lng_min) / DEFAULT_GRID.lng_step), 0, DEFAULT_GRID.cols - 1).astype(int)
+    rows = np.clip(np.floor((DEFAULT_GRID.lat_max - lats) / DEFAULT_GRID.lat_step), 0, DEFAULT_GRID.rows - 1).astype(int)
+    return helper.land_mask()[np.ix_(rows, cols)]
+
+
+# 某網格定義的陸地遮罩：預設網格用 aqi_helper 的遮罩，其他網格由鄉鎮邊界產生並快取於 grid_cache/
+@lru_cache(maxsize=8)
+def land_mask(spec=DEFAULT_GRID):
+    if spec == DEFAULT_GRID:
+        return helper.land_mask()
+
+    path = os.path.join(CACHE_DIR, f"land_mask_{spec.key()}.npy")
+    if os.path.exists(path):
+        return helper.land_mask(path)
+
+    if not os.path.exists(BOUNDARY_PATH):
+        print(f"⚠️ 找不到 {BOUNDARY_PATH}，以 120x120 遮罩取樣產生 {spec.rows}x{spec.cols} 遮罩")
+        mask = resample_default_mask(spec)
+        mask.setflags(write=False)
+        return mask
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    save_land_mask(path, BOUNDARY_PATH, spec)
+    return helper.land_mask(path)
+
+
+# 某統計量的網格立方體資料夾
+def grid_store_dir(statistic=station.DEFAULT_STATISTIC, store_dir=GRID_STORE_DIR):
+    return station.with_statistic(store_dir, statistic)
+
+
+# 寫入一個測項的網格立方體；labels 為每一層的 (year, week, 日期)，statistic 為插值所用測站資料的統計量
+# 先寫暫存檔再改名，中斷時不會留下寫到一半的檔案
+def write_grid_cube(factor, grids, labels, spec=DEFAULT_GRID, statistic=station.DEFAULT_STATISTIC, store_dir=GRID_STORE_DIR):
+    store_dir = grid_store_dir(statistic, store_dir)
+    os.makedirs(store_dir, exist_ok=True)
+    grids = np.asarray(grids, dtype=np.float32)
+
+    meta = {
+        "factor": factor,
+        "statistic": statistic,
+        **spec.to_meta(),
+        "shape": list(grids.shape),
+        "nodata": NODATA,
+        "weeks": [{"year": int(year), "week": int(week), "date": str(date)} for year, week, date in labels],
+    }
+
+    cube_path = os.path.join(store_dir, f"{factor}.npy")
+    meta_path = os.path.join(store_dir, f"{factor}.json")
+    np.save(cube_path + ".tmp.npy", grids)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(cube_path + ".tmp.npy", cube_path)
+    os.replace(meta_path + ".tmp", meta_path)
+    print(f"💾 已寫入網格立方體：{cube_path} {grids.shape}")
+
+
+# 以 memmap 唯讀開啟某統計量的網格立方體，回傳 (cube, meta)；檔案不存在時回傳 (None, None)
+# metadata 記錄的統計量與要求的不同（或舊版立方體沒有記錄）時拒絕讀取，避免把其他統計量當成平均值使用
+def open_grid_cube(factor, statistic=station.DEFAULT_STATISTIC, store_dir=GRID_STORE_DIR):
+    store_dir = grid_store_dir(statistic, store_dir)
+    cube_path = os.path.join(store_dir, f"{factor}.npy")
+    meta_path = os.path.join(store_dir, f"{factor}.json")
+    if not os.path.exists(cube_path) or not os.path.exists(meta_path):
+        return None, None
+
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("statistic") != statistic:
+        raise ValueError(f"網格立方體 {cube_path} 的統計量為 {meta.get('statistic', '未記錄')}，不是 {statistic}，"
+                         f"請以 statistic = \"{statistic}\" 重新執行 5. inverse_weight16-19.ipynb 或 5-2. parallel_idw.py")
+    return np.load(cube_path, mmap_mode="r"), meta
+
+
+# (year, week) → 立方體中的層索引
+def week_index(meta):
+    return {(w["year"], w["week"]): i for i, w in enumerate(meta["weeks"])}
+
+
+# 匯出舊格式的每週 CSV（{factor}_{year}_week_{n}.csv，第一列為欄索引），供仍讀取 5_grid_output 的程式使用
+def export_csv(factor, output_dir, statistic=station.DEFAULT_STATISTIC, store_dir=GRID_STORE_DIR):
+    cube, meta = open_grid_cube(factor, statistic, store_dir)
+    if cube is None:
+        print(f"❌ 網格立方體不存在: {factor}（{statistic}）")
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+    for grid, w in zip(cube, meta["weeks"]):
+        # 整數網格照舊輸出成整數，含 NaN 的週維持浮點數
+        if not np.isnan(grid).any() and (grid == np.round(grid)).all():
+            grid = grid.astype(int)
+        output_file = os.path.join(output_dir, f"{factor}_{w['year']}_week_{w['week']}.csv")
+        # 先寫暫存檔再改名，合併中斷時不會留下寫到一半的 CSV
+        pd.DataFrame(grid).to_csv(output_file + ".tmp", index=False)
+        os.replace(output_file + ".tmp", output_file)
+        print(f"✅ 輸出：{output_file}")
@@ -0,0 +1,384 @@
+# 反距離權重法(IDW)的向量化計算：一次以陣列運算算出整個網格，取代逐格呼叫 calc_idw_value 的 iterrows 迴圈
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+import grid_helper as grid
+import station_helper as station
+
+# IDW 參數：經緯度距離 ×345 換算、距離 300 以外不計、距離小於 1 以 1 計、權重為距離的 3 次方反比
+DIST_SCALE = 345
+CUTOFF = 300
+POWER = 3
+
+# 測站座標檔與不參與插值的離島測站
+SITE_PATH = station.SITE_PATH
+EXCLUDED_SITES = ['富貴角', '馬祖', '金門', '馬公']
+
+# 網格對測站權重矩陣的快取資料夾
+CACHE_DIR = "idw_cache"
+
+# 分塊計算時每塊 (列 × 欄 × 測站) 距離陣列的元素上限，約 32 MB，記憶體用量不隨網格總大小增加
+TILE_ELEMENTS = 4_000_000
+
+# method="auto" 在 (網格數 × 測站數) 達 KDTREE_MIN_PAIRS 且測站數達 KDTREE_MIN_SITES 時改用 KD-tree 半徑搜尋
+# 5-1. benchmark_idw.py 實測：75 站以上時 網格數 × 測站數 約 10 萬起 KD-tree 較快；5 站時 480x480 網格 KD-tree 慢約 3 倍，
+# 20 站時到 480x480（460 萬組）兩者才相當（建樹與逐網格查詢的成本攤不掉），因此另設測站數下限
+KDTREE_MIN_PAIRS = 100_000
+KDTREE_MIN_SITES = 50
+
+
+# method="auto" 的選擇：n_cells 為這次要建的網格數（分塊時為一塊的網格數）
+def auto_method(n_cells, n_sites):
+    return "kdtree" if n_sites >= KDTREE_MIN_SITES and n_cells * n_sites >= KDTREE_MIN_PAIRS else "brute"
+
+
+# 測站名稱與經緯度（欄位 site, lng, lat），排除離島測站
+def load_sites(path=SITE_PATH, excluded=EXCLUDED_SITES):
+    site = pd.read_csv(path)[['sitename', 'twd97lon', 'twd97lat']]
+    site.columns = ['site', 'lng', 'lat']
+    return site[~site['site'].isin(excluded)]
+
+
+# 網格對測站的權重矩陣（網格數 × 測站數，稀疏），距離 300 以外的權重為 0 不存
+# rows 指定列範圍（slice）時只建那幾列，供分塊計算使用
+# method: "brute" 計算所有網格到所有測站的距離；"kdtree" 以 KD-tree 只找 300 範圍內的測站；"auto" 依網格數與測站數選擇（auto_method）
+# k 不為 None 時改為只取每個網格最近的 k 站（仍需在 300 範圍內），適合上千個微型感測器的情況
+def build_weight_matrix(lng, lat, spec=grid.DEFAULT_GRID, rows=None, method="auto", k=None):
+    lng = np.asarray(lng, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+
+    lngs, lats = spec.coords()
+    if rows is not None:
+        lats = lats[rows]
+    n_cells = len(lats) * len(lngs)
+
+    if method == "auto":
+        method = auto_method(n_cells, len(lng))
+
+    if method == "brute" and k is None:
+        # (列, 欄, 測站) 三維廣播計算所有網格到所有測站的距離
+        dx = lngs[None, :, None] - lng[None, None, :]
+        dy = lats[:, None, None] - lat[None, None, :]
+        dis = np.sqrt(dx ** 2 + dy ** 2) * DIST_SCALE
+
+        in_range = dis < CUTOFF
+        dis = np.maximum(dis, 1)
+        wei = np.where(in_range, 1 / dis ** POWER, 0.0)
+        return sparse.csr_matrix(wei.reshape(n_cells, len(lng)))
+
+    # KD-tree 找出候選的 (網格, 測站)，距離以與 brute 相同的算式重算，結果與 brute 完全一致
+    cell, site = neighbor_pairs(lngs, lats, lng, lat, k)
+    dx = lngs[cell % len(lngs)] - lng[site]
+    dy = lats[cell // len(lngs)] - lat[site]
+    dis = np.sqrt(dx ** 2 + dy ** 2) * DIST_SCALE
+
+    in_range = dis < CUTOFF
+    dis = np.maximum(dis[in_range], 1)
+    W = sparse.csr_matrix((1 / dis ** POWER, (cell[in_range], site[in_range])), shape=(n_cells, len(lng)))
+    W.sort_indices()
+    return W
+
+
+# 以 KD-tree 找出每個網格 300 範圍內的測站（k 不為 None 時只取最近的 k 站），回傳 (網格索引, 測站索引)
+def neighbor_pairs(lngs, lats, lng, lat, k=None):
+    xx, yy = np.meshgrid(lngs, lats)
+    cells = np.column_stack([xx.ravel(), yy.ravel()])
+    site_tree = cKDTree(np.column_stack([lng, lat]))
+    radius = CUTOFF / DIST_SCALE * (1 + 1e-9)  # 半徑略放大，邊界上的測站交給精確距離判斷
+
+    if k is None:
+        pairs = cKDTree(cells).sparse_distance_matrix(site_tree, radius, output_type="ndarray")
+        return pairs["i"].astype(np.int64), pairs["j"].astype(np.int64)
+
+    _, idx = site_tree.query(cells, k=min(k, len(lng)), distance_upper_bound=radius)
+    idx = idx.reshape(len(cells), -1)
+    cell = np.repeat(np.arange(len(cells)), idx.shape[1])
+    site = idx.ravel()
+    found = site < len(lng)
+    return cell[found], site[found]
+
+
+# 權重矩陣的快取 key：測站名單與座標、網格定義、IDW 參數任一改變都會重建
+def weight_key(sites, lng, lat, spec=grid.DEFAULT_GRID, k=None):
+    key = {
+        "sites": [str(s) for s in sites],
+        "lng": [float(v) for v in lng],
+        "lat": [float(v) for v in lat],
+        "grid": spec.key(),
+        "idw": [DIST_SCALE, CUTOFF, POWER, k],
+    }
+    return hashlib.sha1(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+# 讀取快取的權重矩陣，不存在時建立並存檔
+# 整個網格的權重矩陣會一次放進記憶體，很細的網格請改用 iter_idw_tiles 分塊計算
+def load_weight_matrix(sites, lng, lat, spec=grid.DEFAULT_GRID, k=None, cache_dir=CACHE_DIR):
+    path = os.path.join(cache_dir, f"idw_weights_{weight_key(sites, lng, lat, spec, k)}.npz")
+    if os.path.exists(path):
+        return sparse.load_npz(path)
+
+    W = build_weight_matrix(lng, lat, spec, k=k)
+    os.makedirs(cache_dir, exist_ok=True)
+    sparse.save_npz(path, W)
+    print(f"💾 已建立權重矩陣快取：{path}")
+    return W
+
+
+# 依有效測站組合（bitmask）快取正規化用的權重矩陣
+# 測站缺值會改變 IDW 分母，但實際上只有少數幾種缺站組合，每種組合只需切一次權重矩陣、算一次分母；超過 maxsize 時淘汰最久未用的組合
+# 分母另外存、乘完再除（而不是先把權重除以分母），結果才會與逐格計算的四捨五入完全一致
+# land 為 W 各列對應網格的陸地遮罩 (列, 欄)，預設為 120x120 網格的遮罩
+class MaskWeightCache:
+    def __init__(self, W, land=None, maxsize=64):
+        self.W = sparse.csr_matrix(W)
+        self.land = grid.DEFAULT_GRID.land_mask() if land is None else land
+        self.shape = self.land.shape
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    # 取得某一有效測站組合的 (有效測站權重矩陣, 權重總和分母, 有值網格遮罩)
+    def get(self, valid):
+        key = np.packbits(valid).tobytes()
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self.misses += 1
+        entry = self._build(valid)
+        self._cache[key] = entry
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return entry
+
+    def _build(self, valid):
+        Wv = self.W[:, np.flatnonzero(valid)]
+        sumwei = np.asarray(Wv.sum(axis=1)).ravel()
+        covered = (sumwei > 0) & self.land.ravel()
+        return Wv[covered], sumwei[covered], covered
+
+    # 快取命中統計，用來觀察跨測項、跨年份重複使用了多少
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "maxsize": self.maxsize}
+
+
+# 鄉鎮取樣點版的權重快取：W 為取樣點對測站的權重矩陣（point_weight_matrix），point_town 為每個取樣點所屬的鄉鎮索引
+# 每種有效測站組合快取一個 (鄉鎮數 × 有效測站數) 的矩陣：各取樣點的 IDW 權重正規化後，在同一鄉鎮內平均
+# 鄉鎮暴露量 = 該矩陣 × 測站數值，所有週一次矩陣乘法，不需經過網格
+class TownWeightCache(MaskWeightCache):
+    def __init__(self, W, point_town, n_towns, maxsize=64):
+        super().__init__(W, land=np.ones(len(point_town), dtype=bool), maxsize=maxsize)
+        self.point_town = np.asarray(point_town)
+        self.n_towns = n_towns
+
+    # 回傳 (鄉鎮權重矩陣, 有值的鄉鎮遮罩)；300 範圍內沒有測站的取樣點不計，所有取樣點都沒有測站的鄉鎮無值
+    def _build(self, valid):
+        Wv, sumwei, covered = super()._build(valid)
+        town = self.point_town[covered]
+        counts = np.bincount(town, minlength=self.n_towns)
+        members = sparse.csr_matrix((1 / counts[town], (town, np.arange(len(town)))), shape=(self.n_towns, len(town)))
+        Tv = members @ sparse.diags(1 / sumwei) @ Wv
+        has_value = counts > 0
+        return Tv[has_value].toarray(), has_value
+
+
+# 任意點對測站的權重矩陣（點數 × 測站數，稀疏），距離與權重的算法與網格相同
+def point_weight_matrix(lng, lat, px, py):
+    lng = np.asarray(lng, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    dx = np.asarray(px, dtype=float)[:, None] - lng[None, :]
+    dy = np.asarray(py, dtype=float)[:, None] - lat[None, :]
+    dis = np.sqrt(dx ** 2 + dy ** 2) * DIST_SCALE
+
+    in_range = dis < CUTOFF
+    dis = np.maximum(dis, 1)
+    return sparse.csr_matrix(np.where(in_range, 1 / dis ** POWER, 0.0))
+
+
+# 以鄉鎮取樣點直接計算各鄉鎮多週的暴露量：values 為 (測站數, 週數)，回傳 (鄉鎮數, 週數)，無值為 NaN（不四捨五入）
+def idw_towns(cache, values):
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    valid = ~np.isnan(values)
+
+    masks, inverse = np.unique(valid, axis=1, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    result = np.full((cache.n_towns, values.shape[1]), np.nan)
+    for k in range(masks.shape[1]):
+        mask = masks[:, k]
+        weeks = np.flatnonzero(inverse == k)
+        Tv, has_value = cache.get(mask)
+        result[np.ix_(has_value, weeks)] = Tv @ values[mask][:, weeks]
+    return result
+
+
+# 一次計算多週網格：values 為 (測站數, 週數)，NaN 表示該週該站無資料
+# 依有效測站組合將週分組，同組的週共用一組快取的權重矩陣與分母，做一次稀疏矩陣乘法；300 範圍內沒有測站或不在陸地範圍的網格為 -1
+def idw_weeks(cache, values):
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    valid = ~np.isnan(values)
+
+    masks, inverse = np.unique(valid, axis=1, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    result = np.full((cache.W.shape[0], values.shape[1]), -1, dtype=int)
+    for k in range(masks.shape[1]):
+        mask = masks[:, k]
+        weeks = np.flatnonzero(inverse == k)
+        Wv, sumwei, covered = cache.get(mask)
+        sumpm = Wv @ values[mask][:, weeks]
+        result[np.ix_(covered, weeks)] = np.round(sumpm / sumwei[:, None])
+    return result.T.reshape(-1, *cache.shape)
+
+
+# 以測站經緯度與數值計算單週整個網格的 IDW 值，NaN 的測站不參與計算
+def idw_grid(lng, lat, values, spec=grid.DEFAULT_GRID):
+    return idw_tiled(lng, lat, values, spec)[0]
+
+
+# 每塊的列數：讓一塊 (列 × 欄 × 測站) 的距離陣列不超過 TILE_ELEMENTS
+def tile_rows_for(spec, n_sites):
+    return max(1, min(spec.rows, TILE_ELEMENTS // (spec.cols * max(n_sites, 1))))
+
+
+# 分塊計算：每次只建 tile_rows 列的權重矩陣並算完所有週，逐塊產出 (起始列, 結束列, (週數, 列數, 欄數))
+# 記憶體用量只與每塊大小有關，1200x1200（約 300 公尺）網格也能在有限記憶體內完成
+def iter_idw_tiles(lng, lat, values, spec=grid.DEFAULT_GRID, tile_rows=None, method="auto", k=None):
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    if tile_rows is None:
+        tile_rows = tile_rows_for(spec, len(values))
+
+    land = spec.land_mask()
+    for r0 in range(0, spec.rows, tile_rows):
+        r1 = min(r0 + tile_rows, spec.rows)
+        W = build_weight_matrix(lng, lat, spec, rows=slice(r0, r1), method=method, k=k)
+        yield r0, r1, idw_weeks(MaskWeightCache(W, land[r0:r1]), values)
+
+
+# 分塊計算並組回完整網格 (週數, 列, 欄)；out 可傳入 memmap 直接寫檔，避免整個立方體放在記憶體
+def idw_tiled(lng, lat, values, spec=grid.DEFAULT_GRID, tile_rows=None, out=None, method="auto", k=None):
+    values = np.asarray(values, dtype=float)
+    n_weeks = 1 if values.ndim == 1 else values.shape[1]
+    if out is None:
+        out = np.empty((n_weeks, *spec.shape), dtype=int)
+    for r0, r1, tile in iter_idw_tiles(lng, lat, values, spec, tile_rows, method, k):
+        out[:, r0:r1] = tile
+    return out
+
+
+# 已提示過改讀寬表的測站立方體路徑（每個路徑只提示一次）
+_cube_fallbacks = set()
+
+
+# 讀取某年所有測項，依 sites 順序組成 (測站數, 週數, 測項數) 陣列；回傳 (陣列, 日期, 實際讀到的測項)
+# input_dir 為測站立方體（station_helper.cube_path()，.npy）時以整數索引直接取出；否則讀取資料夾中的 *_merged_{year}.csv
+# 沒有的測站與非數值皆為 NaN
+def load_factor_cube(input_dir, year, factors, sites):
+    if input_dir.endswith(".npy"):
+        if os.path.exists(input_dir):
+            return load_station_cube(input_dir, year, factors, sites)
+        # 測站立方體未建立（例如剛 clone、尚未執行 3. fill missing.py）時改讀同統計量的舊格式寬表
+        statistic = os.path.splitext(os.path.basename(input_dir))[0]
+        fallback = station.with_statistic(station.STATIONWISE_DIR, statistic)
+        if not os.path.isdir(fallback):
+            raise FileNotFoundError(f"找不到測站立方體 {input_dir} 與寬表資料夾 {fallback}，請先執行 3. fill missing.py")
+        if input_dir not in _cube_fallbacks:
+            _cube_fallbacks.add(input_dir)
+            print(f"⚠️ 找不到測站立方體 {input_dir}，改讀 {fallback}（執行 3. fill missing.py 可建立立方體）")
+        input_dir = fallback
+
+    tables = {}
+    for factor in factors:
+        input_path = os.path.join(input_dir, factor, f"{factor}_merged_{year}.csv")
+        if not os.path.exists(input_path):
+            print(f"❌ 檔案不存在: {input_path}")
+            continue
+
+        df = pd.read_csv(input_path)
+        if '日期' not in df.columns:
+            print(f"⚠️ 檔案格式錯誤（缺少日期）: {input_path}")
+            continue
+        tables[factor] = df.set_index('日期')
+
+    if not tables:
+        return np.empty((len(sites), 0, 0)), pd.Index([]), []
+
+    dates = pd.Index(sorted(set().union(*(df.index for df in tables.values()))))
+    values = np.stack([
+        df.reindex(index=dates, columns=sites).apply(pd.to_numeric, errors='coerce').T.values
+        for df in tables.values()
+    ], axis=2)
+    return values, dates, list(tables)
+
+
+# 從測站立方體取出某年的 (測站數, 週數, 測項數) 陣列；測項名稱不分 PM2.5 / PM25
+def load_station_cube(path, year, factors, sites):
+    cube, meta = station.open_station_cube(path)
+    if cube is None:
+        raise FileNotFoundError(f"測站立方體不完整（缺少 .npy 或 .json）：{path}，請重新執行 3. fill missing.py")
+
+    names = [factor.replace('.', '') for factor in meta["factors"]]
+    found = [factor for factor in factors if factor.replace('.', '') in names]
+    for factor in factors:
+        if factor not in found:
+            print(f"❌ 測站立方體中沒有測項: {factor}")
+
+    layers = np.array([i for i, w in enumerate(meta["weeks"]) if w["year"] == year], dtype=int)
+    columns = [names.index(factor.replace('.', '')) for factor in found]
+    rows = pd.Index([s["station"] for s in meta["stations"]]).get_indexer(list(sites))
+
+    values = np.full((len(rows), len(layers), len(columns)), np.nan)
+    ok = rows >= 0
+    if len(layers) and columns:
+        values[ok] = cube[rows[ok]][:, layers][:, :, columns]
+    dates = pd.Index([meta["weeks"][i]["date"] for i in layers])
+    return values, dates, found if len(layers) else []
+
+
+# 多測項一次插值：values 為 (測站數, 週數, 測項數)，測項當成額外一維與週一起依有效測站組合分組
+# 回傳 (測項數, 週數, 列, 欄)
+def idw_factors(cache, values):
+    n_sites, n_weeks, n_factors = values.shape
+    flat = values.transpose(0, 2, 1).reshape(n_sites, n_factors * n_weeks)
+    return idw_weeks(cache, flat).reshape(n_factors, n_weeks, *cache.shape)
+
+
+# 測站兩兩之間的距離矩陣（測站數 × 測站數），與網格相同以經緯度距離 ×345 換算
+def station_distances(lng, lat):
+    lng = np.asarray(lng, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    dx = lng[:, None] - lng[None, :]
+    dy = lat[:, None] - lat[None, :]
+    return np.sqrt(dx ** 2 + dy ** 2) * DIST_SCALE
+
+
+# 留一交叉驗證：每個測站以其他測站的 IDW 預測，values 為 (測站數, 欄數)，NaN 的測站不參與計算
+# 距離矩陣算一次即可，所有週一次矩陣乘法完成；範圍內沒有其他測站或本身無值的位置為 NaN（不四捨五入）
+def loo_predict(dis, values, power=POWER, cutoff=CUTOFF):
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+
+    wei = np.where(dis < cutoff, 1 / np.maximum(dis, 1) ** power, 0.0)
+    np.fill_diagonal(wei, 0)
+
+    sumpm = wei @ np.where(valid, values, 0)
+    sumwei = wei @ valid
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pred = sumpm / sumwei
+    pred[(sumwei == 0) | ~valid] = np.nan
+    return pred
@@ -0,0 +1,174 @@
+# 周統計資料的讀取：先依路徑與檔名建立檔案索引 (年, 地區, 統計量, 測站)，編碼只依檔案開頭判斷一次並記錄，再以多執行緒同時讀檔
+# 以 Manifest 記錄來源與輸出檔的指紋，來源沒有改變的檔案不重新處理
+import codecs
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+# 原始資料夾結構：周統計資料_獨立/<年>/<地區>/2_周統計4個獨立資料_<地區>/2_周統計_<統計量>_<測站>_<年>.csv
+ROOT_DIR = "周統計資料_獨立"
+FILE_PATTERN = re.compile(
+    r"^(?P<year>\d{4})/(?P<area>[^/]+)/2_周統計4個獨立資料_(?P=area)/2_周統計_(?P<stat>[^_/]+)_(?P<station>[^/]+)_(?P=year)\.csv$"
+)
+
+# 編碼判斷結果的快取（以檔案大小與修改時間判斷是否需要重新判斷）
+ENCODING_CACHE = os.path.join("ingest_cache", "encodings.json")
+
+# 判斷編碼時讀取的開頭位元組數
+SNIFF_BYTES = 64 * 1024
+
+
+# 掃描資料夾建立檔案索引：path, year, area, stat, station；不符合命名規則的檔案略過
+def build_file_index(root_dir=ROOT_DIR):
+    rows = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        for filename in filenames:
+            if not filename.endswith(".csv"):
+                continue
+            path = os.path.join(dirpath, filename)
+            match = FILE_PATTERN.match(os.path.relpath(path, root_dir).replace(os.sep, "/"))
+            if match is None:
+                print(f"⚠️ 檔名不符合規則，略過：{path}")
+                continue
+            rows.append({"path": path, **match.groupdict()})
+
+    index = pd.DataFrame(rows, columns=["path", "year", "area", "stat", "station"])
+    index["year"] = index["year"].astype(int)
+    return index.sort_values(["year", "area", "stat", "station"], ignore_index=True)
+
+
+# 依檔案開頭判斷編碼：有 BOM 為 utf-8-sig，開頭可用 utf-8 解碼為 utf-8，否則為 cp950（原始資料多為 cp950）
+def sniff_encoding(path, n=SNIFF_BYTES):
+    with open(path, "rb") as f:
+        head = f.read(n)
+    if head.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    try:
+        # 讀滿 n 位元組時最後可能切在多位元組字元中間，以 incremental decoder 判斷（結尾不完整的字元不算錯誤）
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=len(head) < n)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp950"
+
+
+# 多個檔案的編碼：快取中大小與修改時間相同的直接使用，其餘重新判斷並更新快取；回傳 {path: encoding}
+def file_encodings(paths, cache_path=ENCODING_CACHE):
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+
+    encodings = {}
+    n_sniffed = 0
+    for path in paths:
+        stat = os.stat(path)
+        entry = cache.get(path)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "encoding": sniff_encoding(path)}
+            cache[path] = entry
+            n_sniffed += 1
+        encodings[path] = entry["encoding"]
+
+    if n_sniffed:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=1)
+        os.replace(cache_path + ".tmp", cache_path)
+    return encodings
+
+
+# 以判斷出的編碼讀取 CSV；判斷錯誤時（例如 utf-8 檔案後段出現 cp950 字元）改用另一種編碼
+def read_csv(path, encoding, **kwargs):
+    try:
+        return pd.read_csv(path, encoding=encoding, **kwargs)
+    except UnicodeDecodeError:
+        fallback = "cp950" if encoding != "cp950" else "utf-8-sig"
+        print(f"⚠️ {path} 以 {encoding} 讀取失敗，改用 {fallback}")
+        return pd.read_csv(path, encoding=fallback, **kwargs)
+
+
+# 同時處理多個檔案：func(*args) 對 tasks 中每一組參數執行，回傳結果依 tasks 順序排列
+# pandas 讀檔大部分時間會釋放 GIL，預設使用執行緒；解析很重時可改用 use_processes=True（func 須為模組層級函式）
+def run_parallel(func, tasks, workers=None, use_processes=False):
+    executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*tasks))) if tasks else []
+
+
+# 檔案內容的雜湊
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# 檔案指紋：大小、修改時間與內容雜湊
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": file_hash(path)}
+
+
+# 處理參數的指紋（欄位、門檻等設定改變時需要重新處理）
+def params_fingerprint(params):
+    return hashlib.sha1(json.dumps(params, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+# 增量處理的紀錄：每個輸出檔記錄其來源檔與輸出檔的指紋及處理參數
+# 來源、輸出與參數都沒有改變的檔案可以略過；大小與修改時間相同就不重算雜湊，修改時間變了但內容相同（例如重新複製）也視為未改變
+class Manifest:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        self._lock = threading.Lock()
+
+    # 每個處理階段一個紀錄檔，放在 ingest_cache/
+    @classmethod
+    def for_stage(cls, output_dir, cache_dir=os.path.dirname(ENCODING_CACHE)):
+        return cls(os.path.join(cache_dir, f"manifest_{os.path.basename(os.path.normpath(output_dir))}.json"))
+
+    @staticmethod
+    def _unchanged(path, recorded):
+        if recorded is None or not os.path.exists(path):
+            return False
+        stat = os.stat(path)
+        if stat.st_size != recorded["size"]:
+            return False
+        return stat.st_mtime_ns == recorded["mtime_ns"] or file_hash(path) == recorded["sha1"]
+
+    # 輸出檔是否仍是由目前的來源檔與參數產生
+    def is_current(self, output_path, input_paths, params=None):
+        with self._lock:
+            entry = self.entries.get(output_path)
+        if entry is None or entry["params"] != params_fingerprint(params):
+            return False
+        if sorted(entry["inputs"]) != sorted(input_paths):
+            return False
+        return self._unchanged(output_path, entry["output"]) and all(
+            self._unchanged(path, entry["inputs"][path]) for path in input_paths
+        )
+
+    # 寫出輸出檔後記錄指紋
+    def record(self, output_path, input_paths, params=None):
+        entry = {
+            "inputs": {path: file_fingerprint(path) for path in input_paths},
+            "output": file_fingerprint(output_path),
+            "params": params_fingerprint(params),
+        }
+        with self._lock:
+            self.entries[output_path] = entry
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock, open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=1)
+        os.replace(self.path + ".tmp", self.path)
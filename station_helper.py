@@ -0,0 +1,170 @@
+# 測站週資料庫：所有測站的週資料存成一份長表 (日期, 地區, 測站, 統計量, 各測項)，依年份分區存成 Parquet
+# 取代 1_filtered_output/、3_interpolated_output/ 數百個單站 CSV；下游只讀需要的年份分區與欄位
+# 目錄結構：<store_dir>/year=<年>/data.parquet（hive 分區，地區、測站、統計量存成類別欄位）
+# 補值後的資料另存成每種統計量一個 (測站, 週, 測項) 立方體（3_station_cube/），附測站座標，IDW 以整數索引直接取用
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+FACTORS = ["NO", "NO2", "NOx", "O3", "PM10", "PM2.5", "SO2"]
+
+# 周統計資料的四種統計量；平均值為預設，其他統計量（例如最大值的高峰週暴露）的輸出資料夾另加統計量名稱
+STATISTICS = ["平均值", "最小值", "最大值", "標準差"]
+DEFAULT_STATISTIC = "平均值"
+
+KEY_COLUMNS = ["date", "area", "station", "statistic"]
+CATEGORY_COLUMNS = ["area", "station", "statistic"]
+
+# 各階段的資料庫位置
+FILTERED_STORE = "1_station_store"
+INTERPOLATED_STORE = "3_station_store"
+STATIONWISE_DIR = "4_interpolated_yearly_stationwise"
+CUBE_DIR = "3_station_cube"
+
+# 測站座標來源（TWD97 欄位實際為經緯度）
+SITE_PATH = "./Preview_Data.csv"
+
+
+# 依統計量區分的資料夾：平均值沿用原名稱，其他加上統計量，例如 4_interpolated_yearly_stationwise_最大值
+def with_statistic(path, statistic=DEFAULT_STATISTIC):
+    path = path.rstrip("/")
+    return path if statistic == DEFAULT_STATISTIC else f"{path}_{statistic}"
+
+
+def partition_path(store_dir, year):
+    return os.path.join(store_dir, f"year={int(year)}", "data.parquet")
+
+
+# 資料庫中已有的年份
+def store_years(store_dir):
+    if not os.path.isdir(store_dir):
+        return []
+    return sorted(
+        int(name.split("=", 1)[1]) for name in os.listdir(store_dir)
+        if name.startswith("year=") and os.path.exists(partition_path(store_dir, name.split("=", 1)[1]))
+    )
+
+
+# 寫入一個年份分區（先寫暫存檔再改名），資料依 測站、統計量、日期 排序
+def write_partition(df, store_dir, year):
+    df = df.drop(columns="year", errors="ignore").copy()
+    df["date"] = pd.to_datetime(df["date"])
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
+    df = df.sort_values(["area", "station", "statistic", "date"], ignore_index=True)
+
+    path = partition_path(store_dir, year)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_parquet(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+# 讀取資料庫：years 只讀指定年份分區，columns 只讀指定欄位（year 欄位一律附上），statistic / areas 篩選統計量與地區
+def read_store(store_dir, years=None, columns=None, statistic=None, areas=None):
+    years = store_years(store_dir) if years is None else [year for year in years if year in store_years(store_dir)]
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+
+    frames = []
+    for year in years:
+        filters = []
+        if statistic is not None:
+            filters.append(("statistic", "==", statistic))
+        if areas is not None:
+            filters.append(("area", "in", list(areas)))
+        df = pd.read_parquet(partition_path(store_dir, year), columns=columns, filters=filters or None)
+        df.insert(0, "year", year)
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=["year"] + (columns or KEY_COLUMNS + FACTORS))
+    df = pd.concat(frames, ignore_index=True)
+    # 不同年份的類別不同時 concat 會變回字串，重新轉成類別
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+# 輸出舊格式的單站 CSV：<output_dir>/<年>/<地區>/2_周統計_<統計量>_<測站>_<年>.csv，欄位 日期, 地區(測站), 各測項
+def export_csv_tree(df, output_dir, factors=FACTORS):
+    paths = []
+    for (year, area, statistic, station), sub in df.groupby(["year", "area", "statistic", "station"], observed=True):
+        path = os.path.join(output_dir, str(year), area, f"2_周統計_{statistic}_{station}_{year}.csv")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        out = pd.DataFrame({"日期": sub["date"].dt.strftime("%Y-%m-%d"), "地區": sub["station"].astype(str)})
+        out[factors] = sub[factors].to_numpy()
+        out.to_csv(path, index=False, encoding="utf-8-sig")
+        paths.append(path)
+    return paths
+
+
+# 長表轉成 (測站數, 週數, 測項數) 陣列，沒有紀錄的 測站 × 週 為 NaN；回傳 (陣列, 測站, 地區, 日期)
+# 測站依 地區、測站名稱 排序；df 須只含一種統計量
+def to_cube(df, factors=FACTORS):
+    keys = df[["area", "station"]].astype(str).drop_duplicates().sort_values(["area", "station"])
+    stations = pd.Index(keys["station"])
+    dates = pd.DatetimeIndex(sorted(df["date"].unique()))
+
+    cube = np.full((len(stations), len(dates), len(factors)), np.nan)
+    cube[stations.get_indexer(df["station"].astype(str)), dates.get_indexer(df["date"])] = df[factors].to_numpy(float)
+    return cube, stations.to_numpy(), keys["area"].to_numpy(), dates
+
+
+# 測站立方體的路徑：<cube_dir>/<統計量>.npy，另有同名 .json 標籤檔
+def cube_path(statistic=DEFAULT_STATISTIC, cube_dir=CUBE_DIR):
+    return os.path.join(cube_dir, f"{statistic}.npy")
+
+
+# 由資料庫建立某統計量的測站立方體 (測站, 週, 測項) 並寫入 cube_dir；標籤檔記錄測站（地區、座標）、每一層的 (year, week, 日期) 與測項
+# 先寫暫存檔再改名，中斷時不會留下寫到一半的檔案；回傳立方體路徑，資料庫沒有該統計量時回傳 None
+def write_station_cube(store_dir, statistic=DEFAULT_STATISTIC, factors=FACTORS, cube_dir=CUBE_DIR, site_path=SITE_PATH):
+    df = read_store(store_dir, columns=["date", "area", "station"] + factors, statistic=statistic)
+    if df.empty:
+        return None
+    values, stations, areas, dates = to_cube(df, factors)
+
+    # 每一層的年份取自資料庫分區，週次為該年第幾筆日期
+    years = df.groupby("date")["year"].first().reindex(dates).to_numpy()
+    weeks = pd.Series(years).groupby(years).cumcount().to_numpy() + 1
+
+    site = pd.read_csv(site_path).set_index("sitename")[["twd97lon", "twd97lat"]]
+    site = site[~site.index.duplicated()].reindex(stations)
+    meta = {
+        "statistic": statistic,
+        "factors": list(factors),
+        "shape": list(values.shape),
+        "stations": [
+            {"station": name, "area": area, "lng": None if np.isnan(lng) else lng, "lat": None if np.isnan(lat) else lat}
+            for name, area, lng, lat in zip(stations, areas, site["twd97lon"], site["twd97lat"])
+        ],
+        "weeks": [
+            {"year": int(year), "week": int(week), "date": date}
+            for year, week, date in zip(years, weeks, dates.strftime("%Y-%m-%d"))
+        ],
+    }
+
+    path = cube_path(statistic, cube_dir)
+    meta_path = os.path.splitext(path)[0] + ".json"
+    os.makedirs(cube_dir, exist_ok=True)
+    np.save(path + ".tmp.npy", values)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(path + ".tmp.npy", path)
+    os.replace(meta_path + ".tmp", meta_path)
+    print(f"💾 已寫入測站立方體：{path} {values.shape}")
+    return path
+
+
+# 以 memmap 唯讀開啟測站立方體，回傳 (cube, meta)；檔案不存在時回傳 (None, None)
+def open_station_cube(path):
+    meta_path = os.path.splitext(path)[0] + ".json"
+    if not os.path.exists(path) or not os.path.exists(meta_path):
+        return None, None
+
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    return np.load(path, mmap_mode="r"), meta
@@ -0,0 +1,41 @@
+# gap_helper 鄰近測站補值的測試：以已知線性關係的模擬測站檢查補值結果
+import numpy as np
+
+import gap_helper as gap
+
+
+# 4 個測站 × 60 週：測站 1 = 2 + 3 × 測站 0，測站 2 與其他測站無關，測站 3 從未量測
+def simulated_values():
+    rng = np.random.default_rng(0)
+    base = rng.uniform(10, 40, 60)
+    values = np.vstack([
+        base,
+        2 + 3 * base,
+        rng.uniform(10, 40, 60),
+        np.full(60, np.nan),
+    ])
+    values[1, 20:50] = np.nan  # 30 週的長缺值，超過 3. fill missing.py 的 skip_threshold
+    return values
+
+
+def test_long_gap_filled_from_linear_neighbor():
+    values = simulated_values()
+    index = gap.neighbor_index(values, k=1, min_corr=0.6, min_overlap=20)
+    assert index["neighbors"][1, 0] == 0
+    np.testing.assert_allclose(index["intercept"][1, 0], 2)
+    np.testing.assert_allclose(index["slope"][1, 0], 3)
+
+    filled = gap.fill_from_neighbors(values, index)
+    np.testing.assert_allclose(filled[1, 20:50], 2 + 3 * values[0, 20:50])
+    # 原本有值的週不變
+    np.testing.assert_array_equal(filled[1, :20], values[1, :20])
+    np.testing.assert_array_equal(filled[1, 50:], values[1, 50:])
+
+
+def test_station_without_neighbors_stays_nan():
+    values = simulated_values()
+    index = gap.neighbor_index(values, k=3, min_corr=0.6, min_overlap=20)
+    assert (index["neighbors"][3] == -1).all()
+
+    filled = gap.fill_from_neighbors(values, index)
+    assert np.isnan(filled[3]).all()
@@ -0,0 +1,214 @@
+# 網格 → 鄉鎮的區域統計：每個網格點所屬鄉鎮只需以空間運算找一次，存成整數標籤陣列，之後每週以 np.bincount 分組平均
+# 取代 6-1、6-2 每個測項每週都對同一批網格點做一次 gpd.sjoin
+# 另有以網格與鄉鎮重疊面積加權的版本（coverage_matrix），所有週一次稀疏矩陣乘法；鄉鎮的總和與權重可再以分組矩陣加總到區域、群集
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import boundary_helper as boundary
+import grid_helper as grid
+import ingest_helper as ingest
+
+# 網格標籤快取資料夾
+CACHE_DIR = "zonal_cache"
+
+# 鄉鎮名稱欄位（boundary_helper 圖層的 town，含縣市，例如「臺北市松山區」）
+TOWN_COLUMN = "town"
+
+
+# 以空間運算找出每個網格點所在的鄉鎮：回傳 (標籤, 鄉鎮名稱)
+# 標籤長度為網格數（依列優先展開），值為鄉鎮名稱的索引，不在任何鄉鎮內為 -1；鄉鎮名稱依字典序排列（與 groupby 相同）
+def build_cell_towns(spec=grid.DEFAULT_GRID, path=grid.BOUNDARY_PATH, column=TOWN_COLUMN):
+    import geopandas as gpd
+
+    taiwan_map = boundary.load_towns(path)
+    grid_lngs, grid_lats = spec.points()
+    grid_gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy(grid_lngs, grid_lats), crs="EPSG:4326")
+
+    joined = gpd.sjoin(grid_gdf, taiwan_map[["geometry", column]], predicate="within", how="inner")
+    joined = joined[~joined.index.duplicated()]  # 鄉鎮邊界重疊時只取第一個
+
+    codes, towns = pd.factorize(joined[column], sort=True)
+    labels = np.full(spec.n_cells, -1, dtype=np.int32)
+    labels[joined.index.values] = codes
+    return labels, np.asarray(towns, dtype=str)
+
+
+# 網格 polygon：網格點在每格的西北角，每格範圍為 [經度, 經度 + 間距] × [緯度 - 間距, 緯度]
+def cell_boxes(spec=grid.DEFAULT_GRID):
+    import shapely
+
+    lngs, lats = spec.points()
+    return shapely.box(lngs, lats - spec.lat_step, lngs + spec.lng_step, lats)
+
+
+# 每個鄉鎮與每個網格的重疊比例（鄉鎮數 × 網格數，稀疏），值為重疊面積 / 網格面積
+# 只以網格中心點判斷時，很小的區（例如台北市、新竹市的區）可能一個網格都分不到；以重疊面積加權則每個鄉鎮都有值
+# 同名的多個 polygon 合併為一列，鄉鎮名稱依字典序排列
+def build_coverage(spec=grid.DEFAULT_GRID, path=grid.BOUNDARY_PATH, column=TOWN_COLUMN):
+    import shapely
+
+    taiwan_map = boundary.load_towns(path)
+    codes, towns = pd.factorize(taiwan_map[column], sort=True)
+
+    boxes = cell_boxes(spec)
+    polygon, cell = shapely.STRtree(boxes).query(taiwan_map.geometry.values, predicate="intersects")
+    overlap = shapely.area(shapely.intersection(boxes[cell], taiwan_map.geometry.values[polygon]))
+    overlap /= spec.lng_step * spec.lat_step
+
+    C = sparse.csr_matrix((overlap, (codes[polygon], cell)), shape=(len(towns), spec.n_cells))
+    C.eliminate_zeros()
+    return C, np.asarray(towns, dtype=str)
+
+
+# 讀取快取的重疊比例矩陣，不存在時建立；快取 key 與 cell_towns 相同
+def coverage_matrix(spec=grid.DEFAULT_GRID, path=grid.BOUNDARY_PATH, column=TOWN_COLUMN, cache_dir=CACHE_DIR):
+    cache_path = os.path.join(cache_dir, f"coverage_{spec.key()}_{column}_{ingest.file_hash(path)[:16]}.npz")
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            C = sparse.csr_matrix((cached["data"], cached["indices"], cached["indptr"]), shape=tuple(cached["shape"]))
+            return C, cached["towns"]
+
+    C, towns = build_coverage(spec, path, column)
+    os.makedirs(cache_dir, exist_ok=True)
+    np.savez(cache_path + ".tmp.npz", data=C.data, indices=C.indices, indptr=C.indptr, shape=C.shape, towns=towns)
+    os.replace(cache_path + ".tmp.npz", cache_path)
+    print(f"💾 已建立鄉鎮重疊比例快取：{cache_path}（{len(towns)} 個鄉鎮，{C.nnz} 個重疊）")
+    return C, towns
+
+
+# 每個鄉鎮的取樣點，供 idw_helper.TownWeightCache 直接由測站計算鄉鎮暴露量：回傳 (經度, 緯度, 所屬鄉鎮索引, 鄉鎮名稱)
+# method: "grid" 落在鄉鎮內的陸地網格點（與網格版的中心點平均相同）；"centroid" 每個 polygon 一個代表點（一定落在 polygon 內）；
+# "subgrid" 每個 polygon 外框內 n × n 的規則點，保留落在 polygon 內的點
+# 沒有任何取樣點的鄉鎮（小於一個網格的區）改用代表點；同名的多個 polygon 合併為同一鄉鎮，鄉鎮名稱依字典序排列
+def town_sample_points(method="grid", spec=grid.DEFAULT_GRID, n=5, path=grid.BOUNDARY_PATH, column=TOWN_COLUMN):
+    import shapely
+
+    taiwan_map = boundary.load_towns(path)
+    codes, towns = pd.factorize(taiwan_map[column], sort=True)
+    geoms = taiwan_map.geometry.values
+
+    if method == "grid":
+        labels, label_towns = cell_towns(spec, path, column)
+        cell = np.flatnonzero((labels >= 0) & spec.land_mask().ravel())
+        px, py = (v[cell] for v in spec.points())
+        town = pd.Index(towns).get_indexer(label_towns[labels[cell]])
+    elif method == "subgrid":
+        u = (np.arange(n) + 0.5) / n
+        px, py, town = [], [], []
+        for code, geom in zip(codes, geoms):
+            x0, y0, x1, y1 = geom.bounds
+            xx, yy = np.meshgrid(x0 + u * (x1 - x0), y0 + u * (y1 - y0))
+            inside = shapely.contains_xy(geom, xx.ravel(), yy.ravel())
+            px.append(xx.ravel()[inside])
+            py.append(yy.ravel()[inside])
+            town.append(np.full(inside.sum(), code))
+        px, py, town = np.concatenate(px), np.concatenate(py), np.concatenate(town)
+    elif method == "centroid":
+        px, py, town = np.empty(0), np.empty(0), np.empty(0, dtype=int)
+    else:
+        raise ValueError(f"未知的取樣方式：{method}")
+
+    # 補上沒有取樣點的鄉鎮：每個 polygon 的代表點
+    missing = ~np.isin(codes, town)
+    rep = shapely.point_on_surface(geoms[missing])
+    px = np.concatenate([px, shapely.get_x(rep)])
+    py = np.concatenate([py, shapely.get_y(rep)])
+    town = np.concatenate([town, codes[missing]])
+    return px, py, town, np.asarray(towns, dtype=str)
+
+
+# 讀取快取的網格鄉鎮標籤，不存在時建立；快取以網格定義與邊界檔雜湊為 key
+def cell_towns(spec=grid.DEFAULT_GRID, path=grid.BOUNDARY_PATH, column=TOWN_COLUMN, cache_dir=CACHE_DIR):
+    cache_path = os.path.join(cache_dir, f"cell_towns_{spec.key()}_{column}_{ingest.file_hash(path)[:16]}.npz")
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            return cached["labels"], cached["towns"]
+
+    labels, towns = build_cell_towns(spec, path, column)
+    os.makedirs(cache_dir, exist_ok=True)
+    np.savez(cache_path + ".tmp.npz", labels=labels, towns=towns)
+    os.replace(cache_path + ".tmp.npz", cache_path)
+    print(f"💾 已建立網格鄉鎮標籤快取：{cache_path}（{len(towns)} 個鄉鎮）")
+    return labels, towns
+
+
+# 將鄉鎮標籤再分組（例如鄉鎮 → 區域）：assign 為 鄉鎮名稱 → 組別 的函式，回傳 (新標籤, 組別名稱)
+def regroup(labels, towns, assign):
+    codes, groups = pd.factorize(pd.Series([assign(town) for town in towns]), sort=True)
+    codes = np.append(codes, -1)  # 標籤 -1（不在任何鄉鎮）維持 -1
+    return codes[labels], np.asarray(groups, dtype=str)
+
+
+# 分組平均：grids 為 (層數, 網格數)，nodata 的網格不計；回傳 (平均值, 網格數)，形狀皆為 (層數, 組數)
+# 所有層一次以 np.bincount 計算，某層某組沒有有效網格時平均為 NaN、網格數為 0
+def zonal_mean(grids, labels, n_groups, nodata=grid.NODATA):
+    grids = np.asarray(grids, dtype=float).reshape(-1, len(labels))
+    n_layers = len(grids)
+
+    valid = (grids != nodata) & (labels >= 0)
+    layer, cell = np.nonzero(valid)
+    index = layer * n_groups + labels[cell]
+
+    sums = np.bincount(index, weights=grids[layer, cell], minlength=n_layers * n_groups)
+    counts = np.bincount(index, minlength=n_layers * n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return means.reshape(n_layers, n_groups), counts.reshape(n_layers, n_groups)
+
+
+# 網格標籤轉成 0/1 的 (組數 × 網格數) 稀疏矩陣，可與 coverage_matrix 的重疊比例矩陣互換使用
+def label_matrix(labels, n_groups):
+    cell = np.flatnonzero(labels >= 0)
+    return sparse.csr_matrix((np.ones(len(cell)), (labels[cell], cell)), shape=(n_groups, len(labels)))
+
+
+# 上層分組矩陣（組數 × 鄉鎮數，0/1 稀疏）：keys 為每個鄉鎮所屬的組別，None / NaN 表示不屬於任何組；組別依字典序排列
+def group_matrix(keys):
+    codes, groups = pd.factorize(pd.Series(keys, dtype=object), sort=True)
+    town = np.flatnonzero(codes >= 0)
+    G = sparse.csr_matrix((np.ones(len(town)), (codes[town], town)), shape=(len(groups), len(codes)))
+    return G, np.asarray(groups)
+
+
+# 分組加總：grids 為 (層數, 網格數)，C 為 (組數 × 網格數) 的權重矩陣（coverage_matrix 或 label_matrix），nodata 的網格不計
+# 所有層一次稀疏矩陣乘法；回傳 (加權總和, 有效權重)，形狀皆為 (層數, 組數)
+# 保留總和與權重（而不是平均）才能再往上層加總：上層平均 = 下層總和相加 / 下層權重相加，與直接以網格計算相同
+def zonal_sums(grids, C, nodata=grid.NODATA):
+    grids = np.asarray(grids, dtype=float).reshape(-1, C.shape[1])
+    valid = grids != nodata
+
+    sums = C @ np.where(valid, grids, 0).T
+    weights = C @ valid.T.astype(float)
+    return sums.T, weights.T
+
+
+# 串流版分組加總：tiles 為 idw_helper.iter_idw_tiles 逐塊產出的 (起始列, 結束列, (層數, 列數, 欄數))
+# 每塊只乘上 C 對應那幾列網格的欄並累加，IDW 的結果不必組成完整網格立方體，也不需寫檔；結果與 zonal_sums 相同
+def zonal_sums_tiled(tiles, C, cols, nodata=grid.NODATA):
+    C = sparse.csc_matrix(C)
+    sums = weights = 0
+    for r0, r1, tile in tiles:
+        tile_sums, tile_weights = zonal_sums(tile, C[:, r0 * cols:r1 * cols], nodata)
+        sums = sums + tile_sums
+        weights = weights + tile_weights
+    return sums, weights
+
+
+# 將下層 (層數, 鄉鎮數) 的總和與權重以分組矩陣 G 加總到上層 (層數, 組數)
+def rollup(G, sums, weights):
+    return (G @ sums.T).T, (G @ weights.T).T
+
+
+# 總和 / 權重，沒有有效網格（權重為 0）的組為 NaN
+def weighted_mean(sums, weights):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / weights
+
+
+# 面積加權平均：C 為 coverage_matrix 的重疊比例矩陣；回傳 (平均值, 有效重疊權重)，形狀皆為 (層數, 鄉鎮數)
+def zonal_weighted_mean(grids, C, nodata=grid.NODATA):
+    sums, weights = zonal_sums(grids, C, nodata)
+    return weighted_mean(sums, weights), weights